@@ -98,6 +98,12 @@ def cli():
     is_flag=True,
     help='Include raw JSON output'
 )
+@click.option(
+    '--script/--no-script',
+    'show_script',
+    default=True,
+    help='Show the unified compliance script'
+)
 @click.option(
     '--verbose',
     is_flag=True,
@@ -128,6 +134,7 @@ def compare(
     threshold: float,
     adaptive: bool,
     output_json: bool,
+    show_script: bool,
     verbose: bool,
     entity_centric: bool,
     all_databases: bool,
@@ -214,7 +221,7 @@ def compare(
         for db_name in selected_databases:
             _perform_comparison(
                 connection_info, db_name, standard, threshold, adaptive, output_json,
-                verbose, entity_centric
+                verbose, entity_centric, show_script
             )
             
             if len(selected_databases) > 1:
@@ -395,7 +402,7 @@ def _display_database_list(databases):
 
 def _perform_comparison(connection_info: dict, database_name: str, standard: str, 
                        threshold: float, adaptive: bool, output_json: bool,
-                       verbose: bool, entity_centric: bool):
+                       verbose: bool, entity_centric: bool, show_script: bool = True):
     """Perform schema comparison for a specific database."""
     print_header(f"Analyzing Database: {database_name}")
     
@@ -421,14 +428,16 @@ def _perform_comparison(connection_info: dict, database_name: str, standard: str
                 entity_centric=entity_centric
             )
         
-        # Display results
-        display_schema_comparison_results(results, show_json=output_json, 
-                                         entity_centric=entity_centric, verbose=verbose)
-        
-        # Show completion message
-        summary = results.get('summary', {})
-        compliance_score = summary.get('overall_compliance_score', 0)
-        show_completion_message(database_name, compliance_score)
+        # Display results and completion message as a single write to the terminal
+        with console:
+            display_schema_comparison_results(results, show_json=output_json, 
+                                             entity_centric=entity_centric, verbose=verbose,
+                                             show_script=show_script)
+            
+            # Show completion message
+            summary = results.get('summary', {})
+            compliance_score = summary.get('overall_compliance_score', 0)
+            show_completion_message(database_name, compliance_score)
         
     except Exception as e:
         print_error(f"Comparison failed for database '{database_name}': {e}")
@@ -5,7 +5,11 @@ This module provides beautiful terminal output formatting using the Rich library
 including tables, progress bars, status messages, and formatted comparison results.
 """
 
+import io
 import json
+import re
+import shutil
+from functools import lru_cache
 from typing import Dict, List, Any, Optional
 from rich.console import Console
 from rich.table import Table
@@ -15,17 +19,35 @@ from rich.text import Text
 from rich.tree import Tree
 from rich.columns import Columns
 from rich.prompt import Prompt, Confirm
-from rich.pretty import Pretty
 from rich.syntax import Syntax
 from rich.markdown import Markdown
+from rich.rule import Rule
+from rich.segment import Segments
 try:
     from database_discovery import DatabaseInfo
 except ImportError:
     DatabaseInfo = None
 
 
-# Global console instance
-console = Console()
+# Global console instance. The terminal size is resolved once here; left unset,
+# Rich re-queries the terminal on every width lookup during rendering.
+_terminal_size = shutil.get_terminal_size()
+console = Console(
+    width=_terminal_size.columns,
+    height=_terminal_size.lines,
+    legacy_windows=False
+)
+
+# Leading host label of a connection URI, e.g. "abc123" in "neo4j+s://abc123.databases.neo4j.io"
+_HOSTNAME_RE = re.compile(r'//([^./]+)')
+
+# "1. ", "2. ", ... for numbered command listings; longer listings format on the fly
+_INDEX_PREFIXES = tuple(f"{i}. " for i in range(1, 65))
+
+
+def _join_items(items: List[str], sep: str = ', ') -> str:
+    """Join items for display, returning a lone item without going through str.join."""
+    return items[0] if len(items) == 1 else sep.join(items)
 
 
 class StatusIndicators:
@@ -80,25 +102,28 @@ def print_info(message: str):
     console.print(f"{StatusIndicators.INFO} {message}", style="blue")
 
 
-def format_database_table(databases: List[DatabaseInfo]) -> Table:
+def format_database_table(databases: List[DatabaseInfo], numbered: bool = False) -> Table:
     """
     Format a list of databases as a rich table.
     
     Args:
         databases: List of database information
+        numbered: Whether to add a selection number column
         
     Returns:
         Rich Table object
     """
     table = Table(title="Available Databases")
     
+    if numbered:
+        table.add_column("#", style="bright_white", width=3)
     table.add_column("Database", style="cyan", no_wrap=True)
     table.add_column("Status", style="green")
     table.add_column("Role", style="blue") 
     table.add_column("Default", justify="center")
     table.add_column("Type", style="dim")
     
-    for db in databases:
+    for i, db in enumerate(databases, 1):
         # Format status with appropriate color
         if db.status.lower() == "online":
             status = f"[green]{db.status}[/green]"
@@ -113,13 +138,10 @@ def format_database_table(databases: List[DatabaseInfo]) -> Table:
         # Format type
         db_type = "system" if db.is_system else "user"
         
-        table.add_row(
-            db.name,
-            status,
-            db.role,
-            default_indicator,
-            db_type
-        )
+        row = [db.name, status, db.role, default_indicator, db_type]
+        if numbered:
+            row.insert(0, str(i))
+        table.add_row(*row)
     
     return table
 
@@ -144,12 +166,11 @@ def format_credentials_info(credentials) -> Panel:
         info_text.append(f"Instance ID: {credentials.instance_id}\n", style="dim")
     
     # Extract hostname for display
-    try:
-        if 'databases.neo4j.io' in credentials.uri:
-            hostname = credentials.uri.split('//')[1].split('.')[0]
-            info_text.append(f"Database: {hostname}\n", style="green")
-    except (IndexError, AttributeError):
-        pass
+    uri = credentials.uri or ''
+    if 'databases.neo4j.io' in uri:
+        hostname_match = _HOSTNAME_RE.search(uri)
+        if hostname_match:
+            info_text.append(f"Database: {hostname_match.group(1)}\n", style="green")
     
     info_text.append(f"Username: {credentials.username}\n", style="blue")
     info_text.append(f"Default Database: {credentials.database}", style="blue")
@@ -223,7 +244,7 @@ def format_comparison_summary(results: Dict[str, Any]) -> Panel:
     return Panel(summary_text, border_style="green", title=f"{StatusIndicators.RESULTS} Comparison Summary")
 
 
-def format_recommendations_table(recommendations: Dict[str, List]) -> Table:
+def format_recommendations_table(recommendations: Dict[str, List]) -> Optional[Table]:
     """
     Format recommendations as a rich table.
     
@@ -231,8 +252,11 @@ def format_recommendations_table(recommendations: Dict[str, List]) -> Table:
         recommendations: Categorized recommendations dictionary
         
     Returns:
-        Rich Table with recommendations
+        Rich Table with recommendations or None if no recommendations
     """
+    if not any(recommendations.values()):
+        return None
+    
     table = Table(title="Compliance Recommendations")
     
     table.add_column("Priority", style="bold", width=10)
@@ -266,7 +290,7 @@ def format_recommendations_table(recommendations: Dict[str, List]) -> Table:
     return table
 
 
-def format_node_renames_table(renames: List[Dict]) -> Table:
+def format_node_renames_table(renames: List[Dict]) -> Optional[Table]:
     """
     Format node label renames as a rich table.
     
@@ -274,8 +298,11 @@ def format_node_renames_table(renames: List[Dict]) -> Table:
         renames: List of node rename recommendations
         
     Returns:
-        Rich Table with node renames
+        Rich Table with node renames or None if no renames
     """
+    if not renames:
+        return None
+    
     table = Table(title="Node Label Changes Required")
     
     table.add_column("Current Label", style="bright_yellow", width=25)
@@ -284,6 +311,7 @@ def format_node_renames_table(renames: List[Dict]) -> Table:
     table.add_column("Priority", style="bold", width=10)
     table.add_column("Cypher Command", style="bright_magenta", width=60)
     
+    arrow = StatusIndicators.ARROW
     for rename in renames:
         priority_color = {
             'CRITICAL': 'bright_red',
@@ -294,7 +322,7 @@ def format_node_renames_table(renames: List[Dict]) -> Table:
         
         table.add_row(
             rename['current_label'],
-            StatusIndicators.ARROW,
+            arrow,
             rename['standard_label'],
             f"[{priority_color}]{rename['priority']}[/{priority_color}]",
             rename['cypher_command']
@@ -303,7 +331,7 @@ def format_node_renames_table(renames: List[Dict]) -> Table:
     return table
 
 
-def format_relationship_renames_table(renames: List[Dict]) -> Table:
+def format_relationship_renames_table(renames: List[Dict]) -> Optional[Table]:
     """
     Format relationship type renames as a rich table.
     
@@ -311,8 +339,11 @@ def format_relationship_renames_table(renames: List[Dict]) -> Table:
         renames: List of relationship rename recommendations
         
     Returns:
-        Rich Table with relationship renames
+        Rich Table with relationship renames or None if no renames
     """
+    if not renames:
+        return None
+    
     table = Table(title="Relationship Type Changes Required")
     
     table.add_column("#", style="bright_white", width=3)
@@ -321,6 +352,7 @@ def format_relationship_renames_table(renames: List[Dict]) -> Table:
     table.add_column("Standard Type", style="bright_blue", width=25)
     table.add_column("Priority", style="bold", width=10)
     
+    arrow = StatusIndicators.ARROW
     for i, rename in enumerate(renames, 1):
         priority_color = {
             'CRITICAL': 'bright_red',
@@ -332,7 +364,7 @@ def format_relationship_renames_table(renames: List[Dict]) -> Table:
         table.add_row(
             str(i),
             rename['current_type'],
-            StatusIndicators.ARROW,
+            arrow,
             rename['standard_type'],
             f"[{priority_color}]{rename['priority']}[/{priority_color}]"
         )
@@ -340,7 +372,7 @@ def format_relationship_renames_table(renames: List[Dict]) -> Table:
     return table
 
 
-def format_property_renames_table(renames: List[Dict]) -> Table:
+def format_property_renames_table(renames: List[Dict]) -> Optional[Table]:
     """
     Format property renames as a rich table.
     
@@ -348,8 +380,11 @@ def format_property_renames_table(renames: List[Dict]) -> Table:
         renames: List of property rename recommendations
         
     Returns:
-        Rich Table with property renames
+        Rich Table with property renames or None if no renames
     """
+    if not renames:
+        return None
+    
     table = Table(title="Property Name Changes Required")
     
     table.add_column("Element", style="bright_white", width=10)
@@ -360,6 +395,7 @@ def format_property_renames_table(renames: List[Dict]) -> Table:
     table.add_column("Priority", style="bold", width=8)
     table.add_column("Cypher Command", style="bright_magenta", width=90)
     
+    arrow = StatusIndicators.ARROW
     for rename in renames:
         priority_color = {
             'CRITICAL': 'bright_red',
@@ -376,7 +412,7 @@ def format_property_renames_table(renames: List[Dict]) -> Table:
             rename['element_type'],
             rename['element_name'],
             rename['current_property'],
-            StatusIndicators.ARROW,
+            arrow,
             rename['standard_property'],
             f"[{priority_color}]{priority_display}[/{priority_color}]",
             rename.get('cypher_command', '')
@@ -385,7 +421,7 @@ def format_property_renames_table(renames: List[Dict]) -> Table:
     return table
 
 
-def format_missing_indexes_table(indexes: List[Dict]) -> Table:
+def format_missing_indexes_table(indexes: List[Dict]) -> Optional[Table]:
     """
     Format missing indexes as a rich table.
     
@@ -393,8 +429,11 @@ def format_missing_indexes_table(indexes: List[Dict]) -> Table:
         indexes: List of missing index recommendations
         
     Returns:
-        Rich Table with missing indexes
+        Rich Table with missing indexes or None if no missing indexes
     """
+    if not indexes:
+        return None
+    
     # Create table with reference numbers for commands
     table = Table(title="Missing Indexes (Execute After Node Renames)", show_lines=True)
     
@@ -416,14 +455,14 @@ def format_missing_indexes_table(indexes: List[Dict]) -> Table:
             str(i),
             index['index_type'],
             index['element_label'],
-            ', '.join(index['properties']),
+            _join_items(index['properties']),
             f"[{priority_color}]{index['priority']}[/{priority_color}]"
         )
     
     return table
 
 
-def format_data_type_mismatches_table(mismatches: List[Dict]) -> Table:
+def format_data_type_mismatches_table(mismatches: List[Dict]) -> Optional[Table]:
     """
     Format data type mismatches as a rich table.
     
@@ -431,8 +470,11 @@ def format_data_type_mismatches_table(mismatches: List[Dict]) -> Table:
         mismatches: List of data type mismatch recommendations
         
     Returns:
-        Rich Table with data type mismatches
+        Rich Table with data type mismatches or None if no mismatches
     """
+    if not mismatches:
+        return None
+    
     table = Table(title="Data Type Mismatches")
     
     table.add_column("Element Type", style="bright_white", width=12)
@@ -442,6 +484,7 @@ def format_data_type_mismatches_table(mismatches: List[Dict]) -> Table:
     table.add_column("Expected Type", style="bright_blue", width=20)
     table.add_column("Priority", style="bold", width=10)
     
+    arrow = StatusIndicators.ARROW
     for mismatch in mismatches:
         priority_color = {
             'CRITICAL': 'bright_red',
@@ -450,14 +493,14 @@ def format_data_type_mismatches_table(mismatches: List[Dict]) -> Table:
             'LOW': 'bright_white'
         }.get(mismatch['priority'], 'white')
         
-        current_types = ', '.join(mismatch['current_types'])
-        expected_types = ', '.join(mismatch['expected_types'])
+        current_types = _join_items(mismatch['current_types'])
+        expected_types = _join_items(mismatch['expected_types'])
         
         table.add_row(
             mismatch['element_type'],
             mismatch['element_property'],
             current_types,
-            StatusIndicators.ARROW,
+            arrow,
             expected_types,
             f"[{priority_color}]{mismatch['priority']}[/{priority_color}]"
         )
@@ -465,6 +508,30 @@ def format_data_type_mismatches_table(mismatches: List[Dict]) -> Table:
     return table
 
 
+def format_cypher_commands(recommendations: List[Dict]) -> Text:
+    """
+    Format the Cypher commands of a recommendation list as a numbered listing.
+    
+    Commands are printed outside their tables to avoid truncation; building them
+    into one Text lets Rich lay out and write the whole listing in a single print.
+    
+    Args:
+        recommendations: Recommendations carrying a 'cypher_command' entry
+        
+    Returns:
+        Rich Text with one numbered command per line
+    """
+    cmd_text = Text()
+    for i, rec in enumerate(recommendations):
+        if i:
+            cmd_text.append("\n")
+        prefix = _INDEX_PREFIXES[i] if i < len(_INDEX_PREFIXES) else f"{i + 1}. "
+        cmd_text.append(prefix, style="bright_white")
+        cmd_text.append(rec['cypher_command'], style="bright_cyan")
+    
+    return cmd_text
+
+
 def format_entity_centric_node(node_data: Dict[str, Any]) -> Panel:
     """
     Format a single node in entity-centric view.
@@ -525,12 +592,14 @@ def format_entity_centric_node(node_data: Dict[str, Any]) -> Panel:
                 missing_node.add(f"{prop['name']}: {prop['type']}{mandatory}")
         
         # Extra properties
-        if props.get('extra'):
-            extra_node = props_node.add(f"[dim]Extra ({len(props['extra'])})[/dim]")
-            for prop in props['extra'][:3]:
+        extra = props.get('extra')
+        if extra:
+            extra_count = len(extra)
+            extra_node = props_node.add(f"[dim]Extra ({extra_count})[/dim]")
+            for prop in extra[:3]:
                 extra_node.add(f"{prop['name']}")
-            if len(props['extra']) > 3:
-                extra_node.add(f"... and {len(props['extra']) - 3} more")
+            if extra_count > 3:
+                extra_node.add(f"... and {extra_count - 3} more")
     
     # Validation warnings
     if node_data.get('validation', {}).get('warnings'):
@@ -560,9 +629,10 @@ def format_entity_centric_relationship(rel_data: Dict[str, Any]) -> Panel:
     tree = Tree(f"[bold]🔗 RELATIONSHIP: {rel_data['source']['type']}[/bold]")
     
     # Show paths
-    if rel_data['source'].get('paths'):
+    paths = rel_data['source'].get('paths')
+    if paths:
         paths_node = tree.add("Paths:")
-        for path in rel_data['source']['paths'][:2]:
+        for path in paths[:2]:
             paths_node.add(f"[dim]{path}[/dim]")
     
     # Match information
@@ -710,17 +780,38 @@ def format_verbose_match_explanation(match_data: Dict[str, Any]) -> Text:
     Returns:
         Rich Text with explanation
     """
+    # Reduce the match data to the hashable values the explanation shows, so
+    # entities that explain identically share one cached Text
+    candidates = match_data.get('all_candidates') or ()
+    top_candidates = tuple(
+        (candidate.label if hasattr(candidate, 'label') else candidate.type, score)
+        for candidate, score in candidates[:5]
+    )
+    text = _build_match_explanation(
+        match_data.get('match_rationale') or '',
+        top_candidates,
+        len(candidates),
+        tuple(match_data.get('validation_warnings') or ())
+    )
+    
+    # Callers may extend the Text, so never hand out the cached instance
+    return text.copy()
+
+
+@lru_cache(maxsize=512)
+def _build_match_explanation(rationale: str, top_candidates: tuple,
+                             candidate_count: int, warnings: tuple) -> Text:
+    """Build the explanation Text for format_verbose_match_explanation."""
     text = Text()
     
     # Show match rationale
-    if match_data.get('match_rationale'):
-        text.append(match_data['match_rationale'] + "\n", style="bright_white")
+    if rationale:
+        text.append(rationale + "\n", style="bright_white")
     
     # Show all candidates if available
-    if match_data.get('all_candidates'):
+    if top_candidates:
         text.append("\nAll candidates considered:\n", style="bold")
-        for i, (candidate, score) in enumerate(match_data['all_candidates'][:5], 1):
-            candidate_name = candidate.label if hasattr(candidate, 'label') else candidate.type
+        for i, (candidate_name, score) in enumerate(top_candidates, 1):
             if score >= 0.7:
                 style = "green"
             elif score >= 0.5:
@@ -730,13 +821,13 @@ def format_verbose_match_explanation(match_data: Dict[str, Any]) -> Text:
             
             text.append(f"  {i}. {candidate_name}: {score:.2f}\n", style=style)
         
-        if len(match_data['all_candidates']) > 5:
-            text.append(f"  ... and {len(match_data['all_candidates']) - 5} more\n", style="dim")
+        if candidate_count > 5:
+            text.append(f"  ... and {candidate_count - 5} more\n", style="dim")
     
     # Show validation warnings
-    if match_data.get('validation_warnings'):
+    if warnings:
         text.append("\n⚠️  Validation Warnings:\n", style="yellow bold")
-        for warning in match_data['validation_warnings']:
+        for warning in warnings:
             text.append(f"  • {warning}\n", style="yellow")
     
     return text
@@ -777,25 +868,11 @@ def prompt_database_selection(databases: List[DatabaseInfo]) -> Optional[str]:
         print_error("No selectable databases found")
         return None
     
-    # Display table
-    table = format_database_table(selectable)
+    # Display table with selection numbers; the Default column marks the recommended choice
+    table = format_database_table(selectable, numbered=True)
     console.print(table)
     
-    # Create choices
-    choices = []
-    display_choices = []
-    
-    for i, db in enumerate(selectable, 1):
-        choices.append(str(i))
-        display_name = db.name
-        if db.is_default:
-            display_name += " (recommended)"
-        display_choices.append(f"{i}. {display_name}")
-    
-    # Show choices
-    console.print("\nSelect a database:")
-    for choice in display_choices:
-        console.print(f"  {choice}")
+    choices = [str(i) for i in range(1, len(selectable) + 1)]
     
     # Get user input
     try:
@@ -837,12 +914,15 @@ def format_json_output(data: Dict[str, Any], title: str = "Results") -> None:
         title: Title for the output
     """
     json_text = json.dumps(data, indent=2)
-    panel = Panel(Pretty(json_text), border_style="dim", title=title)
+    # json.dumps already produced the layout; Syntax only adds highlighting
+    panel = Panel(Syntax(json_text, "json", theme="ansi_dark", word_wrap=True),
+                  border_style="dim", title=title)
     console.print(panel)
 
 
 def display_schema_comparison_results(results: Dict[str, Any], show_json: bool = False,
-                                    entity_centric: bool = False, verbose: bool = False):
+                                    entity_centric: bool = False, verbose: bool = False,
+                                    show_script: bool = True):
     """
     Display comprehensive schema comparison results.
     
@@ -851,7 +931,16 @@ def display_schema_comparison_results(results: Dict[str, Any], show_json: bool =
         show_json: Whether to show raw JSON output
         entity_centric: Whether to use entity-centric formatting
         verbose: Whether to show verbose details
+        show_script: Whether to generate and show the unified compliance script
     """
+    # Hold everything in the console's buffer and write it out once on exit
+    with console:
+        _render_schema_comparison_results(results, show_json, entity_centric, verbose, show_script)
+
+
+def _render_schema_comparison_results(results: Dict[str, Any], show_json: bool,
+                                      entity_centric: bool, verbose: bool, show_script: bool) -> None:
+    """Print the comparison results; see display_schema_comparison_results."""
     # Handle entity-centric format
     if entity_centric and 'entities' in results:
         # Entity-centric view
@@ -863,34 +952,29 @@ def display_schema_comparison_results(results: Dict[str, Any], show_json: bool =
             console.print("\n[bold bright_blue]📦 NODES[/bold bright_blue]\n")
             for node_data in results['entities']['nodes']:
                 panel = format_entity_centric_node(node_data)
-                console.print(panel)
-                console.print()
+                console.print(panel, "")
                 
                 # Show verbose match explanation if enabled
                 if verbose and node_data.get('match'):
                     explanation = format_verbose_match_explanation(node_data)
-                    console.print(explanation)
-                    console.print()
+                    console.print(explanation, end="\n\n")
         
         # Display relationships
         if results['entities'].get('relationships'):
             console.print("\n[bold bright_cyan]🔗 RELATIONSHIPS[/bold bright_cyan]\n")
             for rel_data in results['entities']['relationships']:
                 panel = format_entity_centric_relationship(rel_data)
-                console.print(panel)
-                console.print()
+                console.print(panel, "")
                 
                 # Show verbose match explanation if enabled
                 if verbose and rel_data.get('match'):
                     explanation = format_verbose_match_explanation(rel_data)
-                    console.print(explanation)
-                    console.print()
+                    console.print(explanation, end="\n\n")
         
         # Show statistics if verbose
         if verbose and 'statistics' in results:
             stats_panel = format_matching_statistics(results['statistics'])
-            console.print(stats_panel)
-            console.print()
+            console.print(stats_panel, "")
             
             # Show recommendations from statistics
             if results.get('statistics_recommendations'):
@@ -902,109 +986,81 @@ def display_schema_comparison_results(results: Dict[str, Any], show_json: bool =
         # Show summary at the end
         if 'summary' in results:
             summary_panel = format_comparison_summary(results)
-            console.print(summary_panel)
-            console.print()
+            console.print(summary_panel, "")
         
         return  # Don't show standard format
     
     # Standard format
     # Summary panel
     summary_panel = format_comparison_summary(results)
-    console.print(summary_panel)
-    console.print()
+    console.print(summary_panel, "")
     
     # Show statistics in verbose mode
     if verbose and 'statistics' in results:
         stats_panel = format_matching_statistics(results['statistics'])
-        console.print(stats_panel)
-        console.print()
+        console.print(stats_panel, "")
+    
+    # Checked once; gates both the per-type tables and the unified script below
+    recs_by_type = results.get('recommendations_by_type')
+    has_recs = recs_by_type is not None and any(recs_by_type.values())
     
     # Display new categorized recommendations by type if available
-    if 'recommendations_by_type' in results:
-        recs_by_type = results['recommendations_by_type']
-        
+    if recs_by_type is not None:
         # Node renames
-        if recs_by_type.get('node_renames'):
-            table = format_node_renames_table(recs_by_type['node_renames'])
-            console.print(table)
-            console.print()
+        table = format_node_renames_table(recs_by_type.get('node_renames', []))
+        if table is not None:
+            console.print(table, "")
         
         # Relationship renames
-        if recs_by_type.get('relationship_renames'):
-            table = format_relationship_renames_table(recs_by_type['relationship_renames'])
+        table = format_relationship_renames_table(recs_by_type.get('relationship_renames', []))
+        if table is not None:
             console.print(table)
             
             # Print commands separately to avoid truncation
             console.print("\n[bold bright_magenta]Cypher Commands:[/bold bright_magenta]")
-            for i, rename in enumerate(recs_by_type['relationship_renames'], 1):
-                # Use Text object to ensure proper wrapping
-                from rich.text import Text
-                cmd_text = Text()
-                cmd_text.append(f"{i}. ", style="bright_white")
-                cmd_text.append(rename['cypher_command'], style="bright_cyan")
-                console.print(cmd_text)
-            console.print()
+            console.print(format_cypher_commands(recs_by_type['relationship_renames']), end="\n\n")
         
         # Property renames
-        if recs_by_type.get('property_renames'):
-            table = format_property_renames_table(recs_by_type['property_renames'])
-            console.print(table)
-            console.print()
+        table = format_property_renames_table(recs_by_type.get('property_renames', []))
+        if table is not None:
+            console.print(table, "")
         
         # Missing indexes
-        if recs_by_type.get('missing_indexes'):
-            table = format_missing_indexes_table(recs_by_type['missing_indexes'])
+        table = format_missing_indexes_table(recs_by_type.get('missing_indexes', []))
+        if table is not None:
             console.print(table)
             
             # Print commands separately to avoid truncation
             console.print("\n[bold bright_magenta]Cypher Commands:[/bold bright_magenta]")
-            for i, index in enumerate(recs_by_type['missing_indexes'], 1):
-                # Use Text object to ensure proper wrapping
-                from rich.text import Text
-                cmd_text = Text()
-                cmd_text.append(f"{i}. ", style="bright_white")
-                cmd_text.append(index['cypher_command'], style="bright_cyan")
-                console.print(cmd_text)
-            console.print()
+            console.print(format_cypher_commands(recs_by_type['missing_indexes']), end="\n\n")
         
         # Data type mismatches
-        if recs_by_type.get('data_type_mismatches'):
-            table = format_data_type_mismatches_table(recs_by_type['data_type_mismatches'])
-            console.print(table)
-            console.print()
+        table = format_data_type_mismatches_table(recs_by_type.get('data_type_mismatches', []))
+        if table is not None:
+            console.print(table, "")
     
     # Fall back to old-style recommendations if new format not available
     elif 'categorized_recommendations' in results:
-        recommendations = results['categorized_recommendations']
-        if any(recommendations.values()):  # If there are any recommendations
-            rec_table = format_recommendations_table(recommendations)
-            console.print(rec_table)
-            console.print()
-    
-    # Generate and display unified compliance script if there are recommendations
-    if 'recommendations_by_type' in results:
-        recs = results['recommendations_by_type']
-        if any(recs.values()):  # If there are any recommendations
-            # Generate the unified script
-            unified_script = generate_unified_compliance_script(recs)
-            
-            # Display with syntax highlighting but no side borders
-            from rich.syntax import Syntax
-            from rich.rule import Rule
-            
-            console.print("\n")
-            # Header with accessible blue
-            console.print(Rule("[bold bright_blue]📋 Unified Compliance Script[/bold bright_blue]", style="bright_blue"))
-            console.print()
-            
-            # Script content with colorblind-friendly syntax highlighting
-            # Using 'github-dark' theme which has good contrast and colorblind-friendly colors
-            console.print(Syntax(unified_script, "cypher", theme="github-dark", line_numbers=False))
-            console.print()
-            
-            # Footer
-            console.print(Rule("[dim bright_blue]Copy and execute in Neo4j Browser or cypher-shell[/dim bright_blue]", style="bright_blue"))
-            console.print()
+        rec_table = format_recommendations_table(results['categorized_recommendations'])
+        if rec_table is not None:
+            console.print(rec_table, "")
+    
+    # Generate and display unified compliance script only if it will be shown
+    # has_recs implies recs_by_type is set; the explicit check narrows its type
+    if show_script and has_recs and recs_by_type is not None:
+        # Generate the unified script
+        unified_script = generate_unified_compliance_script(recs_by_type)
+        
+        # Display with syntax highlighting but no side borders
+        console.print("\n")
+        # Header with accessible blue
+        console.print(Rule("[bold bright_blue]📋 Unified Compliance Script[/bold bright_blue]", style="bright_blue"), "")
+        
+        # Script content with colorblind-friendly syntax highlighting
+        console.print(_highlight_cypher(unified_script, console.width), "")
+        
+        # Footer
+        console.print(Rule("[dim bright_blue]Copy and execute in Neo4j Browser or cypher-shell[/dim bright_blue]", style="bright_blue"), "")
     
     # Raw JSON output if requested
     if show_json:
@@ -1022,6 +1078,19 @@ def show_welcome_message():
     console.print()
 
 
+@lru_cache(maxsize=8)
+def _highlight_cypher(script: str, width: int) -> Segments:
+    """
+    Highlight a Cypher script and render it to segments for the given width.
+    
+    Syntax re-runs the Pygments lexer every time it is rendered, so the rendered
+    segments are cached per script and width and replayed on later displays.
+    Uses the 'github-dark' theme, which has good contrast and colorblind-friendly colors.
+    """
+    syntax = Syntax(script, "cypher", theme="github-dark", line_numbers=False)
+    return Segments(console.render(syntax, console.options.update_width(width)))
+
+
 def generate_unified_compliance_script(recommendations_by_type: Dict[str, List]) -> str:
     """
     Generate a unified Cypher script that includes all compliance recommendations.
@@ -1032,80 +1101,107 @@ def generate_unified_compliance_script(recommendations_by_type: Dict[str, List])
     Returns:
         Complete Cypher script as a string
     """
-    script_lines = []
+    script = io.StringIO()
+    write = script.write
     
     # Header
-    script_lines.append("// Neo4j Schema Compliance Script")
-    script_lines.append("// Generated by Neo4j Schema Comparison Tool")
-    script_lines.append("// Execute this script to bring your schema into compliance")
-    script_lines.append("//")
-    script_lines.append("// WARNING: This script will modify your graph schema.")
-    script_lines.append("// Please backup your database before executing.")
-    script_lines.append("")
+    write(
+        "// Neo4j Schema Compliance Script\n"
+        "// Generated by Neo4j Schema Comparison Tool\n"
+        "// Execute this script to bring your schema into compliance\n"
+        "//\n"
+        "// WARNING: This script will modify your graph schema.\n"
+        "// Please backup your database before executing.\n"
+        "\n"
+    )
     
     # 1. Node label renames (must be done first)
     if recommendations_by_type.get('node_renames'):
-        script_lines.append("// ===== STEP 1: Node Label Changes =====")
-        script_lines.append("// Rename node labels to match the standard")
-        script_lines.append("")
+        write(
+            "// ===== STEP 1: Node Label Changes =====\n"
+            "// Rename node labels to match the standard\n"
+            "\n"
+        )
         
         for rename in recommendations_by_type['node_renames']:
-            script_lines.append(f"// Rename {rename['current_label']} to {rename['standard_label']}")
-            script_lines.append(rename['cypher_command'] + ";")
-            script_lines.append("")
+            current = rename['current_label']
+            standard = rename['standard_label']
+            command = rename['cypher_command']
+            write(f"// Rename {current} to {standard}\n{command};\n\n")
     
     # 2. Relationship type renames
     if recommendations_by_type.get('relationship_renames'):
-        script_lines.append("// ===== STEP 2: Relationship Type Changes =====")
-        script_lines.append("// Rename relationship types to match the standard")
-        script_lines.append("")
+        write(
+            "// ===== STEP 2: Relationship Type Changes =====\n"
+            "// Rename relationship types to match the standard\n"
+            "\n"
+        )
         
         for rename in recommendations_by_type['relationship_renames']:
-            script_lines.append(f"// Rename {rename['current_type']} to {rename['standard_type']}")
-            script_lines.append(rename['cypher_command'] + ";")
-            script_lines.append("")
+            current = rename['current_type']
+            standard = rename['standard_type']
+            command = rename['cypher_command']
+            write(f"// Rename {current} to {standard}\n{command};\n\n")
     
     # 3. Property renames
     if recommendations_by_type.get('property_renames'):
-        script_lines.append("// ===== STEP 3: Property Name Changes =====")
-        script_lines.append("// Rename properties to match the standard")
-        script_lines.append("")
+        write(
+            "// ===== STEP 3: Property Name Changes =====\n"
+            "// Rename properties to match the standard\n"
+            "\n"
+        )
         
         # Group by element for better organization
-        node_props = [p for p in recommendations_by_type['property_renames'] if p['element_type'] == 'Node']
-        rel_props = [p for p in recommendations_by_type['property_renames'] if p['element_type'] == 'Relationship']
+        node_props = []
+        rel_props = []
+        for prop in recommendations_by_type['property_renames']:
+            element_type = prop['element_type']
+            if element_type == 'Node':
+                node_props.append(prop)
+            elif element_type == 'Relationship':
+                rel_props.append(prop)
         
         if node_props:
-            script_lines.append("// Node properties:")
+            write("// Node properties:\n")
             for prop in node_props:
-                script_lines.append(f"// {prop['element_name']}.{prop['current_property']} -> {prop['standard_property']}")
-                script_lines.append(prop['cypher_command'] + ";")
-                script_lines.append("")
+                element = prop['element_name']
+                current = prop['current_property']
+                standard = prop['standard_property']
+                command = prop['cypher_command']
+                write(f"// {element}.{current} -> {standard}\n{command};\n\n")
         
         if rel_props:
-            script_lines.append("// Relationship properties:")
+            write("// Relationship properties:\n")
             for prop in rel_props:
-                script_lines.append(f"// {prop['element_name']}.{prop['current_property']} -> {prop['standard_property']}")
-                script_lines.append(prop['cypher_command'] + ";")
-                script_lines.append("")
+                element = prop['element_name']
+                current = prop['current_property']
+                standard = prop['standard_property']
+                command = prop['cypher_command']
+                write(f"// {element}.{current} -> {standard}\n{command};\n\n")
     
     # 4. Create missing indexes (after renames so they use correct labels)
     if recommendations_by_type.get('missing_indexes'):
-        script_lines.append("// ===== STEP 4: Create Missing Indexes =====")
-        script_lines.append("// Add indexes that exist in the standard but are missing")
-        script_lines.append("")
+        write(
+            "// ===== STEP 4: Create Missing Indexes =====\n"
+            "// Add indexes that exist in the standard but are missing\n"
+            "\n"
+        )
         
         for index in recommendations_by_type['missing_indexes']:
-            script_lines.append(f"// {index['index_type']} index on {index['element_label']}({', '.join(index['properties'])})")
-            script_lines.append(index['cypher_command'] + ";")
-            script_lines.append("")
+            index_type = index['index_type']
+            label = index['element_label']
+            properties = ', '.join(index['properties'])
+            command = index['cypher_command']
+            write(f"// {index_type} index on {label}({properties})\n{command};\n\n")
     
     # Footer
-    script_lines.append("// ===== Script Complete =====")
-    script_lines.append("// Your schema should now be compliant with the standard.")
-    script_lines.append("// Run a new comparison to verify compliance.")
+    write(
+        "// ===== Script Complete =====\n"
+        "// Your schema should now be compliant with the standard.\n"
+        "// Run a new comparison to verify compliance."
+    )
     
-    return "\n".join(script_lines)
+    return script.getvalue()
 
 
 def show_completion_message(database_name: str, compliance_score: float):
@@ -8,7 +8,10 @@ Neo4j Transactions Base Model documentation and best practices.
 Based on: https://neo4j.com/developer/industry-use-cases/_attachments/transactions-base-model.txt
 """
 
+import io
 import sys
+from contextlib import contextmanager, redirect_stdout
+from functools import lru_cache
 from pathlib import Path
 
 # Add src to path so we can import our modules
@@ -21,6 +24,114 @@ from compare_models.common.models import (
 )
 
 
+# Scores at or above SUCCESS_THRESHOLD count as successful mappings
+SUCCESS_THRESHOLD = 0.6
+PARTIAL_THRESHOLD = 0.5
+
+# Neo4j Transactions Base Model mapping tables: (source, target, description)
+CUSTOMER_MAPPINGS = (
+    ("CUSTNUM", "customerId", "Primary customer identifier"),
+    ("CUST_ID", "customerId", "Alternative customer ID format"),
+    ("CLIENT_ID", "customerId", "Client-based terminology"),
+    ("FNAME", "firstName", "Customer first name"),
+    ("FIRST_NM", "firstName", "Alternative first name format"),
+    ("LNAME", "lastName", "Customer last name"),
+    ("LAST_NM", "lastName", "Alternative last name format"),
+    ("MIDDLE_NM", "middleName", "Customer middle name"),
+    ("DOB", "dateOfBirth", "Date of birth"),
+    ("BIRTH_DT", "dateOfBirth", "Alternative birth date format"),
+    ("BIRTH_PLACE", "placeOfBirth", "Place of birth"),
+    ("BIRTH_CTRY", "countryOfBirth", "Country of birth"),
+)
+
+ACCOUNT_MAPPINGS = (
+    ("ACCT_NO", "accountNumber", "Primary account identifier"),
+    ("ACCT_NUM", "accountNumber", "Alternative account number format"),
+    ("ACCTNUM", "accountNumber", "Abbreviated account number"),
+    ("ACCT_TYPE", "accountType", "Type of account"),
+    ("ACC_TYPE", "accountType", "Alternative account type format"),
+    ("OPEN_DT", "openDate", "Account opening date"),
+    ("OPEN_DATE", "openDate", "Alternative opening date format"),
+    ("CLOSE_DT", "closedDate", "Account closing date"),
+    ("CLOSED_DATE", "closedDate", "Alternative closing date format"),
+    ("SUSPEND_DT", "suspendedDate", "Account suspension date"),
+)
+
+TRANSACTION_MAPPINGS = (
+    ("TXN_ID", "transactionId", "Primary transaction identifier"),
+    ("TX_ID", "transactionId", "Alternative transaction ID"),
+    ("TRANS_ID", "transactionId", "Full transaction ID format"),
+    ("TXN_AMT", "amount", "Transaction amount"),
+    ("TX_AMT", "amount", "Alternative amount format"),
+    ("AMOUNT", "amount", "Direct amount mapping"),
+    ("TXN_DT", "date", "Transaction date"),
+    ("TXN_DATE", "date", "Alternative transaction date"),
+    ("TX_DATE", "date", "Short transaction date"),
+    ("TXN_MSG", "message", "Transaction message/description"),
+    ("TX_MSG", "message", "Alternative message format"),
+    ("TXN_TYPE", "type", "Transaction type"),
+    ("TX_TYPE", "type", "Alternative type format"),
+    ("CURR", "currency", "Currency code"),
+    ("CURRENCY_CD", "currency", "Full currency code format"),
+)
+
+MOVEMENT_MAPPINGS = (
+    ("MOV_ID", "movementId", "Movement identifier"),
+    ("MOVEMENT_ID", "movementId", "Full movement ID format"),
+    ("MOV_DESC", "description", "Movement description"),
+    ("MOVE_DESC", "description", "Alternative description format"),
+    ("MOV_STATUS", "status", "Movement status"),
+    ("MOVE_STATUS", "status", "Alternative status format"),
+    ("SEQ_NUM", "sequenceNumber", "Sequence number"),
+    ("SEQUENCE_NO", "sequenceNumber", "Alternative sequence format"),
+    ("SEQ_NO", "sequenceNumber", "Short sequence format"),
+)
+
+# (title, rule width, summary label, mapping table) for each alignment section
+ALIGNMENT_SECTIONS = (
+    ("💳 CUSTOMER PROPERTIES (Neo4j Standard)", 40, "Customer Properties", CUSTOMER_MAPPINGS),
+    ("🏛️  ACCOUNT PROPERTIES (Neo4j Standard)", 40, "Account Properties", ACCOUNT_MAPPINGS),
+    ("💸 TRANSACTION PROPERTIES (Neo4j Standard)", 45, "Transaction Properties", TRANSACTION_MAPPINGS),
+    ("📊 MOVEMENT PROPERTIES (Neo4j Standard)", 40, "Movement Properties", MOVEMENT_MAPPINGS),
+)
+
+
+@contextmanager
+def buffered_output():
+    """Collect everything a demo section prints and write it to stdout in one call."""
+    buffer = io.StringIO()
+    try:
+        with redirect_stdout(buffer):
+            yield
+    finally:
+        sys.stdout.write(buffer.getvalue())
+        sys.stdout.flush()
+
+
+@lru_cache(maxsize=None)
+def get_similarity_engine():
+    """Build the composite similarity engine once and share it across demo phases."""
+    return CompositeSimilarity()
+
+
+@lru_cache(maxsize=4096)
+def calculate_similarity(source, target):
+    """Score a (source, target) pair, reusing the result if the pair was already scored."""
+    return get_similarity_engine().calculate(source, target)
+
+
+def classify_score(score):
+    """Return the status marker for a mapping score and whether it counts as a success."""
+    if score >= SUCCESS_THRESHOLD:
+        return "✅", True
+    return ("⚠️" if score >= PARTIAL_THRESHOLD else "❌"), False
+
+
+def score_mappings(mappings):
+    """Score every (source, target, description) row of a mapping table in one pass."""
+    return [calculate_similarity(source, target).score for source, target, _ in mappings]
+
+
 def demonstrate_neo4j_alignment():
     """Demonstrate alignment with Neo4j Transactions Base Model."""
     print("🏦 NEO4J TRANSACTIONS BASE MODEL COMPLIANCE DEMONSTRATION")
@@ -29,118 +140,23 @@ def demonstrate_neo4j_alignment():
     print("https://neo4j.com/developer/industry-use-cases/_attachments/transactions-base-model.txt")
     print()
 
-    comp = CompositeSimilarity()
-
-    # Core Neo4j Transactions Base Model mappings
-    print("💳 CUSTOMER PROPERTIES (Neo4j Standard)")
-    print("-" * 40)
-    customer_mappings = [
-        ("CUSTNUM", "customerId", "Primary customer identifier"),
-        ("CUST_ID", "customerId", "Alternative customer ID format"),
-        ("CLIENT_ID", "customerId", "Client-based terminology"),
-        ("FNAME", "firstName", "Customer first name"),
-        ("FIRST_NM", "firstName", "Alternative first name format"),
-        ("LNAME", "lastName", "Customer last name"),
-        ("LAST_NM", "lastName", "Alternative last name format"),
-        ("MIDDLE_NM", "middleName", "Customer middle name"),
-        ("DOB", "dateOfBirth", "Date of birth"),
-        ("BIRTH_DT", "dateOfBirth", "Alternative birth date format"),
-        ("BIRTH_PLACE", "placeOfBirth", "Place of birth"),
-        ("BIRTH_CTRY", "countryOfBirth", "Country of birth")
-    ]
+    # Score every table in one pass, then report it section by section
+    all_scores = score_mappings([row for *_, mappings in ALIGNMENT_SECTIONS for row in mappings])
+    total_successes = 0
+    total_mappings = len(all_scores)
+    remaining_scores = iter(all_scores)
 
-    customer_successes = 0
-    for source, target, description in customer_mappings:
-        result = comp.calculate(source, target)
-        status = "✅" if result.score >= 0.6 else "⚠️" if result.score >= 0.5 else "❌"
-        print(f"{status} {source:12} → {target:15} {result.score:.3f} | {description}")
-        if result.score >= 0.6:
-            customer_successes += 1
-
-    print(f"\nCustomer Properties Success: {customer_successes}/{len(customer_mappings)} ({customer_successes/len(customer_mappings)*100:.1f}%)")
-
-    print("\n🏛️  ACCOUNT PROPERTIES (Neo4j Standard)")
-    print("-" * 40)
-    account_mappings = [
-        ("ACCT_NO", "accountNumber", "Primary account identifier"),
-        ("ACCT_NUM", "accountNumber", "Alternative account number format"),
-        ("ACCTNUM", "accountNumber", "Abbreviated account number"),
-        ("ACCT_TYPE", "accountType", "Type of account"),
-        ("ACC_TYPE", "accountType", "Alternative account type format"),
-        ("OPEN_DT", "openDate", "Account opening date"),
-        ("OPEN_DATE", "openDate", "Alternative opening date format"),
-        ("CLOSE_DT", "closedDate", "Account closing date"),
-        ("CLOSED_DATE", "closedDate", "Alternative closing date format"),
-        ("SUSPEND_DT", "suspendedDate", "Account suspension date")
-    ]
+    for index, (title, rule_width, summary_label, mappings) in enumerate(ALIGNMENT_SECTIONS):
+        print(f"\n{title}" if index else title)
+        print("-" * rule_width)
+        successes = 0
+        for (source, target, description), score in zip(mappings, remaining_scores):
+            status, succeeded = classify_score(score)
+            print(f"{status} {source:12} → {target:15} {score:.3f} | {description}")
+            successes += succeeded
+        total_successes += successes
 
-    account_successes = 0
-    for source, target, description in account_mappings:
-        result = comp.calculate(source, target)
-        status = "✅" if result.score >= 0.6 else "⚠️" if result.score >= 0.5 else "❌"
-        print(f"{status} {source:12} → {target:15} {result.score:.3f} | {description}")
-        if result.score >= 0.6:
-            account_successes += 1
-
-    print(f"\nAccount Properties Success: {account_successes}/{len(account_mappings)} ({account_successes/len(account_mappings)*100:.1f}%)")
-
-    print("\n💸 TRANSACTION PROPERTIES (Neo4j Standard)")
-    print("-" * 45)
-    transaction_mappings = [
-        ("TXN_ID", "transactionId", "Primary transaction identifier"),
-        ("TX_ID", "transactionId", "Alternative transaction ID"),
-        ("TRANS_ID", "transactionId", "Full transaction ID format"),
-        ("TXN_AMT", "amount", "Transaction amount"),
-        ("TX_AMT", "amount", "Alternative amount format"),
-        ("AMOUNT", "amount", "Direct amount mapping"),
-        ("TXN_DT", "date", "Transaction date"),
-        ("TXN_DATE", "date", "Alternative transaction date"),
-        ("TX_DATE", "date", "Short transaction date"),
-        ("TXN_MSG", "message", "Transaction message/description"),
-        ("TX_MSG", "message", "Alternative message format"),
-        ("TXN_TYPE", "type", "Transaction type"),
-        ("TX_TYPE", "type", "Alternative type format"),
-        ("CURR", "currency", "Currency code"),
-        ("CURRENCY_CD", "currency", "Full currency code format")
-    ]
-
-    transaction_successes = 0
-    for source, target, description in transaction_mappings:
-        result = comp.calculate(source, target)
-        status = "✅" if result.score >= 0.6 else "⚠️" if result.score >= 0.5 else "❌"
-        print(f"{status} {source:12} → {target:15} {result.score:.3f} | {description}")
-        if result.score >= 0.6:
-            transaction_successes += 1
-
-    print(f"\nTransaction Properties Success: {transaction_successes}/{len(transaction_mappings)} ({transaction_successes/len(transaction_mappings)*100:.1f}%)")
-
-    print("\n📊 MOVEMENT PROPERTIES (Neo4j Standard)")
-    print("-" * 40)
-    movement_mappings = [
-        ("MOV_ID", "movementId", "Movement identifier"),
-        ("MOVEMENT_ID", "movementId", "Full movement ID format"),
-        ("MOV_DESC", "description", "Movement description"),
-        ("MOVE_DESC", "description", "Alternative description format"),
-        ("MOV_STATUS", "status", "Movement status"),
-        ("MOVE_STATUS", "status", "Alternative status format"),
-        ("SEQ_NUM", "sequenceNumber", "Sequence number"),
-        ("SEQUENCE_NO", "sequenceNumber", "Alternative sequence format"),
-        ("SEQ_NO", "sequenceNumber", "Short sequence format")
-    ]
-
-    movement_successes = 0
-    for source, target, description in movement_mappings:
-        result = comp.calculate(source, target)
-        status = "✅" if result.score >= 0.6 else "⚠️" if result.score >= 0.5 else "❌"
-        print(f"{status} {source:12} → {target:15} {result.score:.3f} | {description}")
-        if result.score >= 0.6:
-            movement_successes += 1
-
-    print(f"\nMovement Properties Success: {movement_successes}/{len(movement_mappings)} ({movement_successes/len(movement_mappings)*100:.1f}%)")
-
-    # Overall success rate
-    total_successes = customer_successes + account_successes + transaction_successes + movement_successes
-    total_mappings = len(customer_mappings) + len(account_mappings) + len(transaction_mappings) + len(movement_mappings)
+        print(f"\n{summary_label} Success: {successes}/{len(mappings)} ({successes/len(mappings)*100:.1f}%)")
 
     print(f"\n🎯 OVERALL NEO4J COMPLIANCE")
     print("=" * 30)
@@ -167,8 +183,6 @@ def demonstrate_neo4j_naming_conventions():
     print("• Properties: camelCase (customerId, firstName, accountNumber)")
     print()
 
-    comp = CompositeSimilarity()
-
     print("Node Label Compliance:")
     print("-" * 25)
     node_cases = [
@@ -181,7 +195,7 @@ def demonstrate_neo4j_naming_conventions():
     ]
 
     for source, target, description in node_cases:
-        result = comp.calculate(source, target)
+        result = calculate_similarity(source, target)
         print(f"✅ {source:15} → {target:15} {result.score:.3f} | {description}")
 
     print("\nRelationship Type Compliance:")
@@ -196,7 +210,7 @@ def demonstrate_neo4j_naming_conventions():
     ]
 
     for source, target, description in relationship_cases:
-        result = comp.calculate(source, target)
+        result = calculate_similarity(source, target)
         print(f"✅ {source:15} → {target:15} {result.score:.3f} | {description}")
 
     print("\nProperty Name Compliance:")
@@ -211,7 +225,7 @@ def demonstrate_neo4j_naming_conventions():
     ]
 
     for source, target, description in property_cases:
-        result = comp.calculate(source, target)
+        result = calculate_similarity(source, target)
         print(f"✅ {source:15} → {target:15} {result.score:.3f} | {description}")
 
 
@@ -417,9 +431,13 @@ if __name__ == "__main__":
     print()
     
     try:
-        demonstrate_neo4j_alignment()
-        demonstrate_neo4j_naming_conventions()
-        demonstrate_complete_schema_comparison()
+        # Each section is written in a single call instead of line by line
+        with buffered_output():
+            demonstrate_neo4j_alignment()
+        with buffered_output():
+            demonstrate_neo4j_naming_conventions()
+        with buffered_output():
+            demonstrate_complete_schema_comparison()
         
         print("\n\n" + "=" * 65)
         print("✅ NEO4J COMPLIANCE DEMONSTRATION COMPLETE")
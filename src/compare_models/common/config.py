@@ -1,5 +1,7 @@
+import os
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from functools import lru_cache
+from typing import Tuple
 
 
 class Neo4jSettings(BaseSettings):
@@ -13,15 +15,40 @@ class Neo4jSettings(BaseSettings):
     )
 
 
+@lru_cache(maxsize=8)
+def _load_settings(environment: Tuple[Tuple[str, str], ...]) -> Neo4jSettings:
+    """Build settings once per distinct set of NEO4J_* environment variables."""
+    return Neo4jSettings()
+
+
 def get_settings() -> Neo4jSettings:
     """
-    Get fresh Neo4j settings from environment variables.
-    This function creates a new settings instance each time it's called,
-    ensuring it picks up any changes to environment variables.
+    Get Neo4j settings from environment variables.
+    Settings are cached per set of NEO4J_* environment variables, so repeated
+    calls skip re-reading .env while still picking up any changes to the
+    environment (e.g. when the CLI switches database).
     """
-    return Neo4jSettings()
+    environment = tuple(sorted(
+        (key.upper(), value) for key, value in os.environ.items()
+        if key.upper().startswith("NEO4J_")
+    ))
+    return _load_settings(environment)
+
+
+def clear_settings_cache() -> None:
+    """
+    Drop all cached settings so the next get_settings() call re-reads .env.
+    Needed when .env itself changes, which the environment key cannot see.
+    """
+    _load_settings.cache_clear()
 
 
-# For backward compatibility, create a default instance
-# but recommend using get_settings() for dynamic loading
-settings = Neo4jSettings()
+def __getattr__(name: str) -> Neo4jSettings:
+    """
+    Resolve the module-level ``settings`` lazily.
+    Kept for backward compatibility; get_settings() is preferred for dynamic loading.
+    Importing this module no longer reads .env or requires credentials up front.
+    """
+    if name == "settings":
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
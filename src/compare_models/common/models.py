@@ -1,5 +1,15 @@
+import re
+import sys
 from typing import List, Optional, Dict, Any
-from pydantic import BaseModel
+from pydantic import BaseModel, field_validator
+
+# Node labels in relationship paths like (:Customer)-[:HAS]->(:Account)
+NODE_LABEL_RE = re.compile(r':(\w+)')
+
+
+def _intern_all(values: List[str]) -> List[str]:
+    """Intern repeated names (e.g. "String", "DateTime") so schemas share one object per value."""
+    return [sys.intern(value) for value in values]
 
 
 class PropertyDefinition(BaseModel):
@@ -7,6 +17,8 @@ class PropertyDefinition(BaseModel):
     type: List[str]
     mandatory: bool
 
+    _intern_type = field_validator("type")(_intern_all)
+
 
 class Constraint(BaseModel):
     type: str  # "NODE_KEY", "UNIQUE", "EXISTS", etc.
@@ -20,6 +32,14 @@ class Index(BaseModel):
     name: Optional[str] = None  # Index name if available
     config: Optional[Dict[str, Any]] = None  # Additional configuration (dimensions, similarity, etc.)
 
+    @property
+    def signature(self) -> str:
+        """
+        Type and sorted properties, identifying equivalent indexes regardless of name.
+        Computed on each access so it follows later edits to ``properties``.
+        """
+        return f"{self.type}:{':'.join(sorted(self.properties))}"
+
 
 class Node(BaseModel):
     cypher_representation: str
@@ -30,6 +50,8 @@ class Node(BaseModel):
     properties: List[PropertyDefinition]
     detail: Optional[str] = None
 
+    _intern_additional_labels = field_validator("additional_labels")(_intern_all)
+
 
 class Path(BaseModel):
     path: str
@@ -1,10 +1,65 @@
-from typing import Dict, Any, Optional
-from ..common.models import GraphSchema
+import copy
+import re
+from typing import Dict, Any, List, Optional
+from ..common.models import GraphSchema, PropertyDefinition
 from .similarity import FieldMatcher, MatchType
 from .formatters import EntityCentricFormatter, MatchingInspector
 from .statistics import StatisticsCollector
 
 
+# Severity and rename keywords in field recommendations, found with a single case-insensitive scan
+_RECOMMENDATION_KEYWORD_RE = re.compile(r'case sensitivity|type mismatch|mandatory|rename', re.IGNORECASE)
+
+# Keyword -> (category, type suffix, suggestion), in precedence order when several match
+_KEYWORD_CATEGORIES = {
+    'case sensitivity': ('style', 'case_sensitivity', 'Update naming to match standard case conventions'),
+    'type mismatch': ('critical', 'type_mismatch', 'Update property type to match standard'),
+    'mandatory': ('critical', 'mandatory_mismatch', 'Make property mandatory as per standard'),
+}
+
+# Rename priority by match quality; weaker matches fall through to CRITICAL
+_PRIORITY_BY_MATCH_TYPE = {
+    MatchType.EXACT: 'LOW',
+    MatchType.STRONG: 'MEDIUM',
+    MatchType.MODERATE: 'HIGH',
+}
+
+# Static description of the similarity engine, built once at import and copied per call
+_SIMILARITY_ENGINE_INFO = {
+    'techniques': {
+        'levenshtein': {
+            'description': 'Edit distance similarity, good for typos and minor variations',
+            'best_for': ['exact matches', 'typo detection', 'short strings']
+        },
+        'jaro_winkler': {
+            'description': 'String similarity with prefix bias, excellent for abbreviations',
+            'best_for': ['abbreviations', 'common prefixes', 'partial matches']
+        },
+        'fuzzy': {
+            'description': 'Multiple fuzzy matching algorithms including token-based',
+            'best_for': ['general purpose', 'word reordering', 'partial matches']
+        },
+        'abbreviation': {
+            'description': 'Specialized abbreviation expansion and matching',
+            'best_for': ['CUSTNUM -> customer_number', 'database abbreviations']
+        },
+        'semantic': {
+            'description': 'Meaning-based similarity using embeddings',
+            'best_for': ['conceptually similar terms', 'synonyms', 'context understanding']
+        },
+        'contextual': {
+            'description': 'Domain-specific similarity using financial/database knowledge',
+            'best_for': ['banking terms', 'database patterns', 'field types']
+        }
+    },
+    'composition': {
+        'adaptive': 'Automatically adjusts technique weights based on string characteristics',
+        'composite': 'Combines all techniques with configurable weights',
+        'default_threshold': 0.7
+    }
+}
+
+
 def compare_schemas(existing_schema: GraphSchema, standard_schema: GraphSchema, 
                    similarity_threshold: float = 0.7, use_adaptive: bool = True,
                    verbose: bool = False, entity_centric: bool = False) -> Dict[str, Any]:
@@ -54,8 +109,11 @@ def compare_schemas(existing_schema: GraphSchema, standard_schema: GraphSchema,
 def _enhance_comparison_results(results: Dict[str, Any]) -> Dict[str, Any]:
     """
     Enhance the comparison results with additional insights and categorized recommendations.
+    
+    The results dictionary is extended in place and returned; compare_schemas passes
+    the fresh dictionary from FieldMatcher.match_schemas, which nothing else holds.
     """
-    enhanced = results.copy()
+    enhanced = results
     
     # Categorize recommendations by type
     recommendations_by_category = {
@@ -64,6 +122,8 @@ def _enhance_comparison_results(results: Dict[str, Any]) -> Dict[str, Any]:
         'style': [],         # Naming and formatting issues
         'optimization': []   # Performance and best practice improvements
     }
+    critical = recommendations_by_category['critical']
+    important = recommendations_by_category['important']
     
     # New categorization by issue type
     recommendations_by_type = {
@@ -78,12 +138,16 @@ def _enhance_comparison_results(results: Dict[str, Any]) -> Dict[str, Any]:
     for node_match in results.get('node_matches', []):
         if node_match.target_node is None:
             # Unmatched node - critical issue
-            recommendations_by_category['critical'].append({
+            critical.append({
                 'type': 'unmatched_node',
                 'message': f"Node '{node_match.source_node.label}' does not match any standard node",
                 'suggestion': "Consider removing or mapping to a standard node type"
             })
         else:
+            # Property definitions by name, for type lookups on mismatched properties
+            source_props = _properties_by_name(node_match.source_node.properties)
+            target_props = _properties_by_name(node_match.target_node.properties)
+            
             # Analyze label match
             if node_match.label_match:
                 _categorize_field_recommendations(
@@ -104,13 +168,13 @@ def _enhance_comparison_results(results: Dict[str, Any]) -> Dict[str, Any]:
             # Analyze missing properties
             for missing_prop in node_match.missing_properties:
                 if missing_prop.mandatory:
-                    recommendations_by_category['critical'].append({
+                    critical.append({
                         'type': 'missing_mandatory_property',
                         'message': f"Node '{node_match.source_node.label}' missing mandatory property '{missing_prop.property}'",
                         'suggestion': f"Add property '{missing_prop.property}' of type {missing_prop.type}"
                     })
                 else:
-                    recommendations_by_category['important'].append({
+                    important.append({
                         'type': 'missing_optional_property',
                         'message': f"Node '{node_match.source_node.label}' missing optional property '{missing_prop.property}'",
                         'suggestion': f"Consider adding property '{missing_prop.property}' for completeness"
@@ -118,12 +182,14 @@ def _enhance_comparison_results(results: Dict[str, Any]) -> Dict[str, Any]:
             
             # Analyze property matches
             for prop_match in node_match.property_matches:
+                keywords = _scan_recommendation_keywords(prop_match.recommendations)
+                mentioned = frozenset().union(*keywords)
                 _categorize_field_recommendations(
-                    prop_match, 'node_property', recommendations_by_category
+                    prop_match, 'node_property', recommendations_by_category, keywords
                 )
                 
                 # Check for property renames
-                if prop_match.match_type != MatchType.EXACT and 'rename' in ' '.join(prop_match.recommendations).lower():
+                if prop_match.match_type != MatchType.EXACT and 'rename' in mentioned:
                     recommendations_by_type['property_renames'].append({
                         'element_type': 'Node',
                         'element_name': node_match.source_node.label,  # Display source for clarity
@@ -140,10 +206,10 @@ def _enhance_comparison_results(results: Dict[str, Any]) -> Dict[str, Any]:
                     })
                 
                 # Check for data type mismatches
-                if 'type mismatch' in ' '.join(prop_match.recommendations).lower():
+                if 'type mismatch' in mentioned:
                     # Find the property definitions to get type info
-                    source_prop = next((p for p in node_match.source_node.properties if p.property == prop_match.source_field), None)
-                    target_prop = next((p for p in node_match.target_node.properties if p.property == prop_match.target_field), None)
+                    source_prop = source_props.get(prop_match.source_field)
+                    target_prop = target_props.get(prop_match.target_field)
                     
                     recommendations_by_type['data_type_mismatches'].append({
                         'element_type': 'Node',
@@ -155,10 +221,9 @@ def _enhance_comparison_results(results: Dict[str, Any]) -> Dict[str, Any]:
             
             # Check for missing indexes
             if node_match.target_node.indexes:
-                source_index_keys = {f"{idx.type}:{':'.join(sorted(idx.properties))}" for idx in node_match.source_node.indexes}
+                source_index_keys = {idx.signature for idx in node_match.source_node.indexes}
                 for target_index in node_match.target_node.indexes:
-                    target_key = f"{target_index.type}:{':'.join(sorted(target_index.properties))}"
-                    if target_key not in source_index_keys:
+                    if target_index.signature not in source_index_keys:
                         cypher_cmd = _generate_index_cypher(node_match.target_node.label, target_index)
                         recommendations_by_type['missing_indexes'].append({
                             'element_label': node_match.source_node.label,
@@ -171,12 +236,16 @@ def _enhance_comparison_results(results: Dict[str, Any]) -> Dict[str, Any]:
     # Analyze relationship matches
     for rel_match in results.get('relationship_matches', []):
         if rel_match.target_relationship is None:
-            recommendations_by_category['critical'].append({
+            critical.append({
                 'type': 'unmatched_relationship',
                 'message': f"Relationship '{rel_match.source_relationship.type}' does not match any standard relationship",
                 'suggestion': "Consider removing or mapping to a standard relationship type"
             })
         else:
+            # Property definitions by name, for type lookups on mismatched properties
+            source_props = _properties_by_name(rel_match.source_relationship.properties)
+            target_props = _properties_by_name(rel_match.target_relationship.properties)
+            
             if rel_match.type_match:
                 _categorize_field_recommendations(
                     rel_match.type_match, 'relationship_type', recommendations_by_category
@@ -197,12 +266,14 @@ def _enhance_comparison_results(results: Dict[str, Any]) -> Dict[str, Any]:
                     })
             
             for prop_match in rel_match.property_matches:
+                keywords = _scan_recommendation_keywords(prop_match.recommendations)
+                mentioned = frozenset().union(*keywords)
                 _categorize_field_recommendations(
-                    prop_match, 'relationship_property', recommendations_by_category
+                    prop_match, 'relationship_property', recommendations_by_category, keywords
                 )
                 
                 # Check for property renames
-                if prop_match.match_type != MatchType.EXACT and 'rename' in ' '.join(prop_match.recommendations).lower():
+                if prop_match.match_type != MatchType.EXACT and 'rename' in mentioned:
                     recommendations_by_type['property_renames'].append({
                         'element_type': 'Relationship',
                         'element_name': rel_match.source_relationship.type,  # Display source for clarity
@@ -219,10 +290,10 @@ def _enhance_comparison_results(results: Dict[str, Any]) -> Dict[str, Any]:
                     })
                 
                 # Check for data type mismatches
-                if 'type mismatch' in ' '.join(prop_match.recommendations).lower():
+                if 'type mismatch' in mentioned:
                     # Find the property definitions to get type info
-                    source_prop = next((p for p in rel_match.source_relationship.properties if p.property == prop_match.source_field), None)
-                    target_prop = next((p for p in rel_match.target_relationship.properties if p.property == prop_match.target_field), None)
+                    source_prop = source_props.get(prop_match.source_field)
+                    target_prop = target_props.get(prop_match.target_field)
                     
                     recommendations_by_type['data_type_mismatches'].append({
                         'element_type': 'Relationship',
@@ -238,8 +309,8 @@ def _enhance_comparison_results(results: Dict[str, Any]) -> Dict[str, Any]:
     
     # Add priority scores
     enhanced['priority_scores'] = {
-        'critical_issues': len(recommendations_by_category['critical']),
-        'important_issues': len(recommendations_by_category['important']),
+        'critical_issues': len(critical),
+        'important_issues': len(important),
         'style_issues': len(recommendations_by_category['style']),
         'optimization_opportunities': len(recommendations_by_category['optimization'])
     }
@@ -255,33 +326,37 @@ def _enhance_comparison_results(results: Dict[str, Any]) -> Dict[str, Any]:
 
 
 def _categorize_field_recommendations(field_match, field_type: str, 
-                                    categories: Dict[str, list]) -> None:
-    """Categorize field match recommendations by severity."""
+                                    categories: Dict[str, list],
+                                    keywords: Optional[List[frozenset]] = None) -> None:
+    """
+    Categorize field match recommendations by severity.
+    
+    Callers that already scanned the recommendations pass the per-recommendation
+    keywords from _scan_recommendation_keywords so they are not scanned again.
+    """
     if field_match.match_type == MatchType.EXACT:
         return  # No recommendations needed for exact matches
     
-    for recommendation in field_match.recommendations:
-        if 'case sensitivity' in recommendation.lower():
-            categories['style'].append({
-                'type': f'{field_type}_case_sensitivity',
-                'message': recommendation,
-                'suggestion': 'Update naming to match standard case conventions'
-            })
-        elif 'type mismatch' in recommendation.lower():
-            categories['critical'].append({
-                'type': f'{field_type}_type_mismatch',
-                'message': recommendation,
-                'suggestion': 'Update property type to match standard'
-            })
-        elif 'mandatory' in recommendation.lower():
-            categories['critical'].append({
-                'type': f'{field_type}_mandatory_mismatch',
+    recommendations = field_match.recommendations
+    if not recommendations:
+        return
+    
+    if keywords is None:
+        keywords = _scan_recommendation_keywords(recommendations)
+    score = field_match.similarity_result.score
+    
+    for recommendation, found in zip(recommendations, keywords):
+        keyword = next((keyword for keyword in _KEYWORD_CATEGORIES if keyword in found), None)
+        if keyword:
+            category, kind, suggestion = _KEYWORD_CATEGORIES[keyword]
+            categories[category].append({
+                'type': f'{field_type}_{kind}',
                 'message': recommendation,
-                'suggestion': 'Make property mandatory as per standard'
+                'suggestion': suggestion
             })
         else:
             # General naming recommendations
-            if field_match.similarity_result.score >= 0.8:
+            if score >= 0.8:
                 categories['style'].append({
                     'type': f'{field_type}_naming',
                     'message': recommendation,
@@ -295,6 +370,22 @@ def _categorize_field_recommendations(field_match, field_type: str,
                 })
 
 
+def _scan_recommendation_keywords(recommendations: List[str]) -> List[frozenset]:
+    """Lower-cased keywords found in each recommendation, in a single scan apiece."""
+    return [
+        frozenset(keyword.lower() for keyword in _RECOMMENDATION_KEYWORD_RE.findall(recommendation))
+        for recommendation in recommendations
+    ]
+
+
+def _properties_by_name(properties: List[PropertyDefinition]) -> Dict[str, PropertyDefinition]:
+    """Index property definitions by name, keeping the first of any duplicates."""
+    by_name: Dict[str, PropertyDefinition] = {}
+    for prop in properties:
+        by_name.setdefault(prop.property, prop)
+    return by_name
+
+
 def _calculate_compliance_level(compliance_score: float, 
                               recommendations: Dict[str, list]) -> str:
     """Calculate overall compliance level based on score and recommendation severity."""
@@ -315,14 +406,7 @@ def _calculate_compliance_level(compliance_score: float,
 
 def _get_priority_from_match_type(match_type: MatchType) -> str:
     """Convert MatchType to priority string."""
-    if match_type == MatchType.EXACT:
-        return 'LOW'
-    elif match_type == MatchType.STRONG:
-        return 'MEDIUM'
-    elif match_type == MatchType.MODERATE:
-        return 'HIGH'
-    else:
-        return 'CRITICAL'
+    return _PRIORITY_BY_MATCH_TYPE.get(match_type, 'CRITICAL')
 
 
 def _generate_index_cypher(label: str, index_info) -> str:
@@ -355,41 +439,10 @@ def get_similarity_engine_info() -> Dict[str, Any]:
     Get information about the available similarity techniques and their capabilities.
     
     Returns:
-        Dictionary with details about similarity engine capabilities
+        Dictionary with details about similarity engine capabilities; a fresh copy,
+        so callers may modify it
     """
-    return {
-        'techniques': {
-            'levenshtein': {
-                'description': 'Edit distance similarity, good for typos and minor variations',
-                'best_for': ['exact matches', 'typo detection', 'short strings']
-            },
-            'jaro_winkler': {
-                'description': 'String similarity with prefix bias, excellent for abbreviations',
-                'best_for': ['abbreviations', 'common prefixes', 'partial matches']
-            },
-            'fuzzy': {
-                'description': 'Multiple fuzzy matching algorithms including token-based',
-                'best_for': ['general purpose', 'word reordering', 'partial matches']
-            },
-            'abbreviation': {
-                'description': 'Specialized abbreviation expansion and matching',
-                'best_for': ['CUSTNUM -> customer_number', 'database abbreviations']
-            },
-            'semantic': {
-                'description': 'Meaning-based similarity using embeddings',
-                'best_for': ['conceptually similar terms', 'synonyms', 'context understanding']
-            },
-            'contextual': {
-                'description': 'Domain-specific similarity using financial/database knowledge',
-                'best_for': ['banking terms', 'database patterns', 'field types']
-            }
-        },
-        'composition': {
-            'adaptive': 'Automatically adjusts technique weights based on string characteristics',
-            'composite': 'Combines all techniques with configurable weights',
-            'default_threshold': 0.7
-        }
-    }
+    return copy.deepcopy(_SIMILARITY_ENGINE_INFO)
 
 
 def _collect_statistics(results: Dict[str, Any], stats_collector: StatisticsCollector) -> None:
@@ -6,13 +6,25 @@ about each entity (node or relationship) together, making it easier to
 understand the complete context of each match.
 """
 
-from typing import Dict, Any, List, Optional
+from collections import Counter
+from functools import lru_cache
+from itertools import chain, islice
+from typing import Dict, Any, List, Optional, Sequence
 from dataclasses import dataclass
-from ...common.models import Node, Relationship, PropertyDefinition
+from ...common.models import Node, Relationship, PropertyDefinition, NODE_LABEL_RE
 from ..similarity import FieldMatch, NodeMatch, RelationshipMatch, MatchType
 
+# Shared stand-in for results without metadata; only ever read
+_EMPTY_METADATA: Dict[str, Any] = {}
 
-@dataclass
+
+@lru_cache(maxsize=4096)
+def _labels_in_path(path: str) -> frozenset:
+    """Node labels in a single relationship path, scanned once per distinct path."""
+    return frozenset(NODE_LABEL_RE.findall(path))
+
+
+@dataclass(slots=True)
 class EntityReport:
     """Represents a complete report for a single entity (node or relationship)."""
     entity_type: str  # 'node' or 'relationship'
@@ -45,6 +57,9 @@ class EntityCentricFormatter:
             verbose: Whether to include detailed matching information
         """
         self.verbose = verbose
+        # Lower-cased property names per node (by id) for the comparison being formatted;
+        # a standard node matched by several customer nodes is folded once
+        self._lowercase_names: Dict[int, frozenset] = {}
     
     def format_comparison_results(self, results: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -56,92 +71,98 @@ class EntityCentricFormatter:
         Returns:
             Reformatted results organized by entity
         """
-        formatted = {
-            'entities': {
-                'nodes': [],
-                'relationships': []
-            },
-            'summary': results.get('summary', {}),
-            'statistics': self._generate_statistics(results),
-            'unmatched_summary': self._generate_unmatched_summary(results)
-        }
-        
-        # Process node matches
-        for node_match in results.get('node_matches', []):
-            entity_report = self._process_node_match(node_match)
-            formatted['entities']['nodes'].append(entity_report)
-        
-        # Process relationship matches
-        for rel_match in results.get('relationship_matches', []):
-            entity_report = self._process_relationship_match(rel_match)
-            formatted['entities']['relationships'].append(entity_report)
-        
-        return formatted
+        try:
+            node_matches = results.get('node_matches') or ()
+            rel_matches = results.get('relationship_matches') or ()
+            process_node_match = self._process_node_match
+            process_relationship_match = self._process_relationship_match
+            
+            formatted = {
+                'entities': {
+                    # Process node matches
+                    'nodes': [
+                        process_node_match(node_match)
+                        for node_match in node_matches
+                    ],
+                    # Process relationship matches
+                    'relationships': [
+                        process_relationship_match(rel_match)
+                        for rel_match in rel_matches
+                    ]
+                },
+                'summary': results.get('summary', {}),
+                'statistics': self._generate_statistics(node_matches, rel_matches),
+                'unmatched_summary': self._generate_unmatched_summary(node_matches, rel_matches)
+            }
+            
+            return formatted
+        finally:
+            # Node ids are only meaningful within one comparison
+            self._lowercase_names.clear()
     
     def _process_node_match(self, node_match: NodeMatch) -> Dict[str, Any]:
         """Process a single node match into an entity report."""
         source_node = node_match.source_node
         target_node = node_match.target_node
         
+        source_properties = [p.property for p in source_node.properties]
+        
         report = {
             'entity_type': 'node',
             'source': {
                 'label': source_node.label,
-                'property_count': len(source_node.properties),
-                'properties': [p.property for p in source_node.properties]
+                'property_count': len(source_properties),
+                'properties': source_properties
             }
         }
         
         if target_node:
             # We have a match
+            label_match = node_match.label_match
             report['match'] = {
                 'label': target_node.label,
-                'score': node_match.label_match.similarity_result.score if node_match.label_match else 0.0,
-                'type': node_match.label_match.match_type.value if node_match.label_match else 'no_match',
+                'score': label_match.similarity_result.score if label_match else 0.0,
+                'type': label_match.match_type.value if label_match else 'no_match',
                 'confidence': node_match.overall_confidence
             }
             
             # Add similarity details if verbose
-            if self.verbose and node_match.label_match:
+            if self.verbose and label_match:
                 report['match']['similarity_breakdown'] = self._extract_similarity_breakdown(
-                    node_match.label_match
+                    label_match
                 )
             
             # Process property matches
             report['properties'] = {
-                'matches': [],
-                'missing': [],
-                'extra': []
+                'matches': [
+                    {
+                        'source': prop_match.source_field,
+                        'target': prop_match.target_field,
+                        'score': prop_match.similarity_result.score,
+                        'type': prop_match.match_type.value,
+                        'recommendations': prop_match.recommendations
+                    }
+                    for prop_match in node_match.property_matches
+                ],
+                # Missing properties (in standard but not in source)
+                'missing': [
+                    {
+                        'name': missing_prop.property,
+                        'type': missing_prop.type,
+                        'mandatory': missing_prop.mandatory
+                    }
+                    for missing_prop in node_match.missing_properties
+                ],
+                # Extra properties (in source but not in standard)
+                'extra': [
+                    {'name': extra_prop.property, 'type': extra_prop.type}
+                    for extra_prop in node_match.extra_properties
+                ]
             }
             
-            for prop_match in node_match.property_matches:
-                prop_info = {
-                    'source': prop_match.source_field,
-                    'target': prop_match.target_field,
-                    'score': prop_match.similarity_result.score,
-                    'type': prop_match.match_type.value,
-                    'recommendations': prop_match.recommendations
-                }
-                
-                if self.verbose:
+            if self.verbose:
+                for prop_info, prop_match in zip(report['properties']['matches'], node_match.property_matches):
                     prop_info['techniques'] = self._extract_similarity_breakdown(prop_match)
-                
-                report['properties']['matches'].append(prop_info)
-            
-            # Missing properties (in standard but not in source)
-            for missing_prop in node_match.missing_properties:
-                report['properties']['missing'].append({
-                    'name': missing_prop.property,
-                    'type': missing_prop.type,
-                    'mandatory': missing_prop.mandatory
-                })
-            
-            # Extra properties (in source but not in standard)
-            for extra_prop in node_match.extra_properties:
-                report['properties']['extra'].append({
-                    'name': extra_prop.property,
-                    'type': extra_prop.type
-                })
             
             # Validation checks
             report['validation'] = self._validate_node_match(node_match)
@@ -161,65 +182,64 @@ class EntityCentricFormatter:
         source_rel = rel_match.source_relationship
         target_rel = rel_match.target_relationship
         
+        source_properties = [p.property for p in source_rel.properties]
+        
         report = {
             'entity_type': 'relationship',
             'source': {
                 'type': source_rel.type,
-                'property_count': len(source_rel.properties),
-                'properties': [p.property for p in source_rel.properties],
+                'property_count': len(source_properties),
+                'properties': source_properties,
                 'paths': [p.path for p in source_rel.paths]
             }
         }
         
         if target_rel:
             # We have a match
+            type_match = rel_match.type_match
             report['match'] = {
                 'type': target_rel.type,
-                'score': rel_match.type_match.similarity_result.score if rel_match.type_match else 0.0,
-                'match_type': rel_match.type_match.match_type.value if rel_match.type_match else 'no_match',
+                'score': type_match.similarity_result.score if type_match else 0.0,
+                'match_type': type_match.match_type.value if type_match else 'no_match',
                 'confidence': rel_match.overall_confidence
             }
             
             # Add similarity details if verbose
-            if self.verbose and rel_match.type_match:
+            if self.verbose and type_match:
                 report['match']['similarity_breakdown'] = self._extract_similarity_breakdown(
-                    rel_match.type_match
+                    type_match
                 )
             
             # Process property matches
             report['properties'] = {
-                'matches': [],
-                'missing': [],
-                'extra': []
+                'matches': [
+                    {
+                        'source': prop_match.source_field,
+                        'target': prop_match.target_field,
+                        'score': prop_match.similarity_result.score,
+                        'type': prop_match.match_type.value,
+                        'recommendations': prop_match.recommendations
+                    }
+                    for prop_match in rel_match.property_matches
+                ],
+                # Missing and extra properties
+                'missing': [
+                    {
+                        'name': missing_prop.property,
+                        'type': missing_prop.type,
+                        'mandatory': missing_prop.mandatory
+                    }
+                    for missing_prop in rel_match.missing_properties
+                ],
+                'extra': [
+                    {'name': extra_prop.property, 'type': extra_prop.type}
+                    for extra_prop in rel_match.extra_properties
+                ]
             }
             
-            for prop_match in rel_match.property_matches:
-                prop_info = {
-                    'source': prop_match.source_field,
-                    'target': prop_match.target_field,
-                    'score': prop_match.similarity_result.score,
-                    'type': prop_match.match_type.value,
-                    'recommendations': prop_match.recommendations
-                }
-                
-                if self.verbose:
+            if self.verbose:
+                for prop_info, prop_match in zip(report['properties']['matches'], rel_match.property_matches):
                     prop_info['techniques'] = self._extract_similarity_breakdown(prop_match)
-                
-                report['properties']['matches'].append(prop_info)
-            
-            # Missing and extra properties
-            for missing_prop in rel_match.missing_properties:
-                report['properties']['missing'].append({
-                    'name': missing_prop.property,
-                    'type': missing_prop.type,
-                    'mandatory': missing_prop.mandatory
-                })
-            
-            for extra_prop in rel_match.extra_properties:
-                report['properties']['extra'].append({
-                    'name': extra_prop.property,
-                    'type': extra_prop.type
-                })
             
             # Validation checks
             report['validation'] = self._validate_relationship_match(rel_match)
@@ -239,15 +259,16 @@ class EntityCentricFormatter:
         breakdown = {}
         
         # Get metadata from similarity result
-        metadata = field_match.similarity_result.metadata or {}
+        similarity_result = field_match.similarity_result
+        metadata = similarity_result.metadata or _EMPTY_METADATA
         
         # Extract technique contributions
         if 'technique_scores' in metadata:
             breakdown['techniques'] = metadata['technique_scores']
         else:
             # Fallback to basic info
-            breakdown['primary_technique'] = field_match.similarity_result.technique
-            breakdown['score'] = field_match.similarity_result.score
+            breakdown['primary_technique'] = similarity_result.technique
+            breakdown['score'] = similarity_result.score
         
         # Add any expansion information
         if 'expanded_text1' in metadata:
@@ -269,27 +290,29 @@ class EntityCentricFormatter:
         if not node_match.target_node:
             return validation
         
+        label_result = node_match.label_match.similarity_result if node_match.label_match else None
+        
         # Check property compatibility
-        source_props = {p.property.lower() for p in node_match.source_node.properties}
-        target_props = {p.property.lower() for p in node_match.target_node.properties}
+        source_props = self._lowercase_property_names(node_match.source_node)
+        target_props = self._lowercase_property_names(node_match.target_node)
         
         if source_props and target_props:
             # Calculate Jaccard similarity of property sets
             intersection = len(source_props & target_props)
-            union = len(source_props | target_props)
+            union = len(source_props) + len(target_props) - intersection
             validation['property_compatibility'] = intersection / union if union > 0 else 0.0
             
             # Flag if property compatibility is very low
-            if validation['property_compatibility'] < 0.2 and node_match.label_match:
-                if node_match.label_match.similarity_result.score > 0.7:
+            if validation['property_compatibility'] < 0.2 and label_result:
+                if label_result.score > 0.7:
                     validation['warnings'].append(
-                        f"High label similarity ({node_match.label_match.similarity_result.score:.2f}) "
+                        f"High label similarity ({label_result.score:.2f}) "
                         f"but low property compatibility ({validation['property_compatibility']:.2f})"
                     )
         
         # Check for semantic mismatches
-        if node_match.label_match and node_match.label_match.similarity_result.technique == 'semantic':
-            if node_match.label_match.similarity_result.score < 0.8:
+        if label_result and label_result.technique == 'semantic':
+            if label_result.score < 0.8:
                 validation['warnings'].append(
                     "Match based primarily on semantic similarity - verify this is correct"
                 )
@@ -297,14 +320,23 @@ class EntityCentricFormatter:
         # Check for missing mandatory properties
         mandatory_missing = [p for p in node_match.missing_properties if p.mandatory]
         if mandatory_missing:
+            missing_count = len(mandatory_missing)
             validation['issues'].append(
-                f"Missing {len(mandatory_missing)} mandatory properties: "
-                f"{', '.join(p.property for p in mandatory_missing[:3])}"
-                f"{'...' if len(mandatory_missing) > 3 else ''}"
+                f"Missing {missing_count} mandatory properties: "
+                f"{', '.join(p.property for p in islice(mandatory_missing, 3))}"
+                f"{'...' if missing_count > 3 else ''}"
             )
         
         return validation
     
+    def _lowercase_property_names(self, node: Node) -> frozenset:
+        """Lower-cased property names of a node, for case-insensitive comparisons."""
+        names = self._lowercase_names.get(id(node))
+        if names is None:
+            names = frozenset(p.property.lower() for p in node.properties)
+            self._lowercase_names[id(node)] = names
+        return names
+    
     def _validate_relationship_match(self, rel_match: RelationshipMatch) -> Dict[str, Any]:
         """Validate a relationship match for potential issues."""
         validation = {
@@ -318,8 +350,8 @@ class EntityCentricFormatter:
         
         # Check if relationship paths are compatible
         # This is a simplified check - could be enhanced
-        source_paths = set(p.path for p in rel_match.source_relationship.paths)
-        target_paths = set(p.path for p in rel_match.target_relationship.paths)
+        source_paths = frozenset(p.path for p in rel_match.source_relationship.paths)
+        target_paths = frozenset(p.path for p in rel_match.target_relationship.paths)
         
         # Extract node types from paths (simplified)
         source_nodes = self._extract_nodes_from_paths(source_paths)
@@ -336,19 +368,14 @@ class EntityCentricFormatter:
         
         return validation
     
-    def _extract_nodes_from_paths(self, paths: set) -> set:
+    def _extract_nodes_from_paths(self, paths: frozenset) -> frozenset:
         """Extract node labels from relationship paths."""
-        import re
-        nodes = set()
-        for path in paths:
-            # Simple regex to extract node labels from paths like (:Customer)-[:HAS]->(:Account)
-            matches = re.findall(r':(\w+)', path)
-            nodes.update(matches)
-        return nodes
+        return frozenset().union(*map(_labels_in_path, paths))
     
-    def _generate_statistics(self, results: Dict[str, Any]) -> Dict[str, Any]:
+    def _generate_statistics(self, node_matches: Sequence[NodeMatch],
+                             rel_matches: Sequence[RelationshipMatch]) -> Dict[str, Any]:
         """Generate matching statistics from results."""
-        stats = {
+        stats: Dict[str, Any] = {
             'node_matches': {
                 'exact': 0,
                 'strong': 0,
@@ -367,45 +394,43 @@ class EntityCentricFormatter:
             'property_match_rate': 0.0
         }
         
-        # Count node matches by type
-        for node_match in results.get('node_matches', []):
-            if node_match.target_node and node_match.label_match:
-                match_type = node_match.label_match.match_type.value
-                stats['node_matches'][match_type] = stats['node_matches'].get(match_type, 0) + 1
-                
-                # Track technique usage
-                technique = node_match.label_match.similarity_result.technique
-                stats['technique_usage'][technique] = stats['technique_usage'].get(technique, 0) + 1
-            else:
-                stats['node_matches']['no_match'] += 1
-        
-        # Count relationship matches by type
-        for rel_match in results.get('relationship_matches', []):
-            if rel_match.target_relationship and rel_match.type_match:
-                match_type = rel_match.type_match.match_type.value
-                stats['relationship_matches'][match_type] = stats['relationship_matches'].get(match_type, 0) + 1
-                
-                # Track technique usage
-                technique = rel_match.type_match.similarity_result.technique
-                stats['technique_usage'][technique] = stats['technique_usage'].get(technique, 0) + 1
-            else:
-                stats['relationship_matches']['no_match'] += 1
-        
-        # Calculate property match rate
         total_properties = 0
         matched_properties = 0
+        matched_labels = []
         
-        for node_match in results.get('node_matches', []):
+        # Collect matched labels, accumulating property counts in the same pass
+        for node_match in node_matches:
             if node_match.source_node:
                 total_properties += len(node_match.source_node.properties)
                 matched_properties += len(node_match.property_matches)
+            
+            if node_match.target_node and node_match.label_match:
+                matched_labels.append(node_match.label_match)
         
+        matched_types = [
+            rel_match.type_match for rel_match in rel_matches
+            if rel_match.target_relationship and rel_match.type_match
+        ]
+        
+        # Count matches by type (the zeroed defaults cover every MatchType value)
+        stats['node_matches'].update(Counter(m.match_type.value for m in matched_labels))
+        stats['node_matches']['no_match'] += len(node_matches) - len(matched_labels)
+        stats['relationship_matches'].update(Counter(m.match_type.value for m in matched_types))
+        stats['relationship_matches']['no_match'] += len(rel_matches) - len(matched_types)
+        
+        # Track technique usage
+        stats['technique_usage'] = dict(Counter(
+            m.similarity_result.technique for m in chain(matched_labels, matched_types)
+        ))
+        
+        # Calculate property match rate
         if total_properties > 0:
             stats['property_match_rate'] = matched_properties / total_properties
         
         return stats
     
-    def _generate_unmatched_summary(self, results: Dict[str, Any]) -> Dict[str, Any]:
+    def _generate_unmatched_summary(self, node_matches: Sequence[NodeMatch],
+                                    rel_matches: Sequence[RelationshipMatch]) -> Dict[str, Any]:
         """Generate summary of why entities didn't match."""
         unmatched = {
             'nodes': [],
@@ -413,7 +438,7 @@ class EntityCentricFormatter:
         }
         
         # Find unmatched nodes
-        for node_match in results.get('node_matches', []):
+        for node_match in node_matches:
             if not node_match.target_node:
                 unmatched['nodes'].append({
                     'label': node_match.source_node.label,
@@ -422,7 +447,7 @@ class EntityCentricFormatter:
                 })
         
         # Find unmatched relationships
-        for rel_match in results.get('relationship_matches', []):
+        for rel_match in rel_matches:
             if not rel_match.target_relationship:
                 unmatched['relationships'].append({
                     'type': rel_match.source_relationship.type,
@@ -6,13 +6,34 @@ the step-by-step process and which similarity techniques contributed
 to each match decision.
 """
 
-from typing import Dict, Any, List, Optional, Tuple
+import heapq
+from collections import Counter
+from operator import itemgetter
+from typing import Dict, Any, Iterator, List, Optional, Tuple
 from dataclasses import dataclass, field
-from ...common.models import Node, Relationship, PropertyDefinition
+from ...common.models import Node, Relationship, PropertyDefinition, NODE_LABEL_RE
 from ..similarity import SimilarityResult, MatchType
 
+# Reader-facing reason for each primary technique ({source}/{target} filled in per match)
+_TECHNIQUE_EXPLANATIONS = {
+    'abbreviation': "abbreviation expansion ({source} → {target})",
+    'semantic': "semantic/meaning similarity",
+    'fuzzy': "fuzzy string matching",
+    'levenshtein': "character-level similarity",
+    'jaro_winkler': "string similarity with prefix matching",
+    'contextual': "domain-specific knowledge"
+}
 
-@dataclass
+_MATCH_INTERPRETATIONS = {
+    MatchType.EXACT: "This is an exact match.",
+    MatchType.STRONG: "This is a strong match with high confidence.",
+    MatchType.MODERATE: "This is a moderate match - manual verification recommended.",
+    MatchType.WEAK: "This is a weak match - careful review needed.",
+    MatchType.NO_MATCH: "No acceptable match found."
+}
+
+
+@dataclass(slots=True)
 class MatchingStep:
     """Represents a single step in the matching process."""
     step_number: int
@@ -22,7 +43,7 @@ class MatchingStep:
     details: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class MatchCandidate:
     """Represents a candidate match with detailed scoring information."""
     target_name: str
@@ -31,9 +52,14 @@ class MatchCandidate:
     match_type: MatchType
     validation_result: Dict[str, Any]
     recommendation: str
+    primary_technique: Optional[str] = None  # Highest-scoring technique, derived when not given
+    
+    def __post_init__(self) -> None:
+        if self.primary_technique is None and self.technique_scores:
+            self.primary_technique = max(self.technique_scores, key=self.technique_scores.__getitem__)
 
 
-@dataclass
+@dataclass(slots=True)
 class MatchingTrace:
     """Complete trace of a matching decision."""
     source_name: str
@@ -180,26 +206,22 @@ class MatchingInspector:
         
         # Identify the primary contributor
         if technique_scores:
-            sorted_techniques = sorted(technique_scores.items(), key=lambda x: x[1], reverse=True)
-            primary_technique, primary_score = sorted_techniques[0]
+            # Only the primary and two secondary contributors are reported
+            top_techniques = heapq.nlargest(3, technique_scores.items(), key=itemgetter(1))
+            primary_technique, primary_score = top_techniques[0]
             
-            technique_explanations = {
-                'abbreviation': f"abbreviation expansion ({source_name} → {target_name})",
-                'semantic': "semantic/meaning similarity",
-                'fuzzy': "fuzzy string matching",
-                'levenshtein': "character-level similarity",
-                'jaro_winkler': "string similarity with prefix matching",
-                'contextual': "domain-specific knowledge"
-            }
-            
-            explanation = technique_explanations.get(primary_technique, primary_technique)
+            explanation = _TECHNIQUE_EXPLANATIONS.get(primary_technique)
+            if explanation:
+                explanation = explanation.format(source=source_name, target=target_name)
+            else:
+                explanation = primary_technique
             explanation_parts.append(f"Primary match reason: {explanation} ({primary_score:.1%})")
             
             # Add secondary contributors if significant
-            if len(sorted_techniques) > 1:
+            if len(top_techniques) > 1:
                 secondary_contributors = [
                     f"{tech} ({score:.1%})" 
-                    for tech, score in sorted_techniques[1:3]
+                    for tech, score in top_techniques[1:]
                     if score > 0.5
                 ]
                 if secondary_contributors:
@@ -208,16 +230,8 @@ class MatchingInspector:
                     )
         
         # Add match type interpretation
-        match_interpretations = {
-            MatchType.EXACT: "This is an exact match.",
-            MatchType.STRONG: "This is a strong match with high confidence.",
-            MatchType.MODERATE: "This is a moderate match - manual verification recommended.",
-            MatchType.WEAK: "This is a weak match - careful review needed.",
-            MatchType.NO_MATCH: "No acceptable match found."
-        }
-        
-        if match_type in match_interpretations:
-            explanation_parts.append(match_interpretations[match_type])
+        if match_type in _MATCH_INTERPRETATIONS:
+            explanation_parts.append(_MATCH_INTERPRETATIONS[match_type])
         
         return " ".join(explanation_parts)
     
@@ -266,12 +280,12 @@ class MatchingInspector:
         source_props = {p.property.lower(): p for p in source_node.properties}
         target_props = {p.property.lower(): p for p in target_node.properties}
         
-        # Find common properties
-        common_keys = set(source_props.keys()) & set(target_props.keys())
-        all_keys = set(source_props.keys()) | set(target_props.keys())
+        # Find common properties (in source order) and size the union from them
+        common_keys = [key for key in source_props if key in target_props]
+        union_size = len(source_props) + len(target_props) - len(common_keys)
         
-        if all_keys:
-            result['property_analysis']['compatibility_score'] = len(common_keys) / len(all_keys)
+        if union_size:
+            result['property_analysis']['compatibility_score'] = len(common_keys) / union_size
             
             # Check for type compatibility in common properties
             for key in common_keys:
@@ -324,20 +338,12 @@ class MatchingInspector:
         result['path_analysis']['target_paths'] = target_paths
         
         # Simple compatibility check - could be enhanced
-        import re
-        source_nodes = set()
-        target_nodes = set()
-        
-        for path in source_paths:
-            nodes = re.findall(r':(\w+)', path)
-            source_nodes.update(nodes)
+        target_nodes = {label for path in target_paths for label in NODE_LABEL_RE.findall(path)}
         
-        for path in target_paths:
-            nodes = re.findall(r':(\w+)', path)
-            target_nodes.update(nodes)
-        
-        # Check if there's any overlap in node types
-        if source_nodes & target_nodes:
+        # Check if there's any overlap in node types, stopping at the first shared label
+        if not target_nodes.isdisjoint(
+            match.group(1) for path in source_paths for match in NODE_LABEL_RE.finditer(path)
+        ):
             result['path_analysis']['compatible'] = True
         else:
             result['warnings'] = result.get('warnings', [])
@@ -349,25 +355,21 @@ class MatchingInspector:
     
     def get_trace_summary(self) -> Dict[str, Any]:
         """Get a summary of all matching traces."""
+        successful_matches = sum(1 for trace in self.traces if trace.selected_match)
+        
+        # Count technique usage across every step
+        technique_usage = Counter(
+            step.technique for trace in self.traces for step in trace.steps
+        )
+        
         summary = {
             'total_traces': len(self.traces),
-            'successful_matches': 0,
-            'failed_matches': 0,
-            'technique_usage': {},
+            'successful_matches': successful_matches,
+            'failed_matches': len(self.traces) - successful_matches,
+            'technique_usage': dict(technique_usage),
             'common_issues': {}
         }
         
-        for trace in self.traces:
-            if trace.selected_match:
-                summary['successful_matches'] += 1
-            else:
-                summary['failed_matches'] += 1
-            
-            # Count technique usage
-            for step in trace.steps:
-                technique = step.technique
-                summary['technique_usage'][technique] = summary['technique_usage'].get(technique, 0) + 1
-        
         return summary
     
     def export_traces(self, detailed: bool = False) -> List[Dict[str, Any]]:
@@ -380,8 +382,18 @@ class MatchingInspector:
         Returns:
             List of trace dictionaries
         """
-        exported = []
+        return list(self.iter_traces(detailed))
+    
+    def iter_traces(self, detailed: bool = False) -> Iterator[Dict[str, Any]]:
+        """
+        Export traces one at a time, for callers that stream them out.
         
+        Args:
+            detailed: Whether to include all step details
+            
+        Yields:
+            One trace dictionary per recorded trace
+        """
         for trace in self.traces:
             trace_data = {
                 'source': trace.source_name,
@@ -393,8 +405,7 @@ class MatchingInspector:
                         'target': c.target_name,
                         'score': c.final_score,
                         'match_type': c.match_type.value,
-                        'primary_technique': max(c.technique_scores.items(), 
-                                               key=lambda x: x[1])[0] if c.technique_scores else 'unknown'
+                        'primary_technique': c.primary_technique or 'unknown'
                     }
                     for c in trace.candidates
                 ]
@@ -412,6 +423,4 @@ class MatchingInspector:
                     for step in trace.steps
                 ]
             
-            exported.append(trace_data)
-        
-        return exported
\ No newline at end of file
+            yield trace_data
\ No newline at end of file
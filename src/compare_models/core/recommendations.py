@@ -6,7 +6,7 @@ from typing import List, Dict, Any, Optional, Tuple
 from dataclasses import dataclass
 from enum import Enum
 
-from ..common.models import GraphSchema, Node, Relationship, PropertyDefinition
+from ..common.models import GraphSchema, Node, Relationship, PropertyDefinition, Index
 from .similarity import NodeMatch, RelationshipMatch, FieldMatch, MatchType
 
 
@@ -488,9 +488,9 @@ class RecommendationGenerator:
         """Generate unique key for constraint comparison."""
         return f"{constraint.type}:{':'.join(sorted(constraint.properties))}"
     
-    def _index_key(self, index) -> str:
+    def _index_key(self, index: Index) -> str:
         """Generate unique key for index comparison."""
-        return f"{index.type}:{':'.join(sorted(index.properties))}"
+        return index.signature
     
     def _get_next_id(self) -> str:
         """Get next recommendation ID."""
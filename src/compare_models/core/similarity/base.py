@@ -2,11 +2,18 @@
 Base classes and interfaces for similarity calculations.
 """
 
+import re
 from abc import ABC, abstractmethod
 from typing import Dict, Any, Optional
 from pydantic import BaseModel
 from .abbreviations import NEO4J_ABBREVIATIONS
 
+# Patterns used on every expansion, compiled once at import
+_CAMEL_BOUNDARY_RE = re.compile(r'([a-z])([A-Z])')
+_DELIMITER_RUN_RE = re.compile(r'[\s_-]+')
+_CAMEL_CASE_RE = re.compile(r'[a-z][A-Z]')
+_WORD_RE = re.compile(r'[A-Z][a-z]*|[a-z]+')
+
 
 class SimilarityResult(BaseModel):
     """
@@ -93,6 +100,10 @@ class AbbreviationExpander:
     
     def __init__(self):
         self.ABBREVIATIONS = NEO4J_ABBREVIATIONS
+        # Abbreviations by length (longest first) for greedy matching, sorted once
+        self._abbreviations_by_length = sorted(self.ABBREVIATIONS.keys(), key=len, reverse=True)
+        # Each distinct text is normalized and expanded once, however many pairs it appears in
+        self._expanded: Dict[str, str] = {}
     
     def expand_text(self, text: str) -> str:
         """
@@ -104,10 +115,13 @@ class AbbreviationExpander:
         Returns:
             Text with abbreviations expanded
         """
+        expanded = self._expanded.get(text)
+        if expanded is not None:
+            return expanded
+        
         # Convert to lowercase and handle delimiters
-        import re
-        processed_text = re.sub(r'([a-z])([A-Z])', r'\1_\2', text)  # CamelCase to snake_case
-        processed_text = re.sub(r'[\s_-]+', '_', processed_text).lower()  # Normalize delimiters
+        processed_text = _CAMEL_BOUNDARY_RE.sub(r'\1_\2', text)  # CamelCase to snake_case
+        processed_text = _DELIMITER_RUN_RE.sub('_', processed_text).lower()  # Normalize delimiters
         
         parts = processed_text.split('_')
         expanded_parts = []
@@ -121,12 +135,10 @@ class AbbreviationExpander:
                 remaining_part = part
                 expanded_sub_parts = []
                 
-                # Sort abbreviations by length to match longest ones first
-                sorted_abbrevs = sorted(self.ABBREVIATIONS.keys(), key=len, reverse=True)
-                
                 while remaining_part:
                     found_match = False
-                    for abbrev in sorted_abbrevs:
+                    # Match longest abbreviations first
+                    for abbrev in self._abbreviations_by_length:
                         if remaining_part.startswith(abbrev):
                             expanded_sub_parts.append(self.ABBREVIATIONS[abbrev])
                             remaining_part = remaining_part[len(abbrev):]
@@ -140,7 +152,9 @@ class AbbreviationExpander:
                 
                 expanded_parts.append('_'.join(expanded_sub_parts))
         
-        return '_'.join(expanded_parts)
+        expanded = '_'.join(expanded_parts)
+        self._expanded[text] = expanded
+        return expanded
     
     def get_variations(self, text: str) -> list[str]:
         """
@@ -169,9 +183,8 @@ class AbbreviationExpander:
             variations.append(text.replace('_', ' '))  # Spaces instead of underscores
         
         # Handle camelCase breakdown
-        import re
-        if re.search(r'[a-z][A-Z]', text):  # Has camelCase
-            snake_case = re.sub(r'([a-z])([A-Z])', r'\1_\2', text).lower()
+        if _CAMEL_CASE_RE.search(text):  # Has camelCase
+            snake_case = _CAMEL_BOUNDARY_RE.sub(r'\1_\2', text).lower()
             variations.append(snake_case)
             variations.append(snake_case.replace('_', ' '))
         
@@ -190,9 +203,8 @@ class AbbreviationExpander:
     
     def _extract_words(self, text: str) -> list[str]:
         """Extract individual words from camelCase or compound text."""
-        import re
         # Handle camelCase
-        words = re.findall(r'[A-Z][a-z]*|[a-z]+', text)
+        words = _WORD_RE.findall(text)
         return [word.lower() for word in words if word]
     
     def _to_camel_case(self, text: str) -> str:
@@ -2,7 +2,7 @@
 High-level field matcher that uses the similarity engine for schema comparison.
 """
 
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Callable, Optional, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
 
@@ -20,7 +20,7 @@ class MatchType(Enum):
     NO_MATCH = "no_match"
 
 
-@dataclass
+@dataclass(slots=True)
 class FieldMatch:
     """Represents a match between two schema elements."""
     source_field: str
@@ -36,7 +36,7 @@ class FieldMatch:
         return self.similarity_result.score >= min_threshold
 
 
-@dataclass
+@dataclass(slots=True)
 class NodeMatch:
     """Represents a match between two nodes."""
     source_node: Node
@@ -51,7 +51,7 @@ class NodeMatch:
     validation_warnings: List[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class RelationshipMatch:
     """Represents a match between two relationships."""
     source_relationship: Relationship
@@ -148,13 +148,30 @@ class FieldMatcher:
         
         return results
     
+    @staticmethod
+    def _index_by_name(elements: List[Any], name_of: Callable[[Any], str]) -> Dict[str, Any]:
+        """Index schema elements by their exact name, keeping the first of any duplicates."""
+        index: Dict[str, Any] = {}
+        for element in elements:
+            index.setdefault(name_of(element), element)
+        return index
+    
     def _match_nodes(self, customer_nodes: List[Node], 
                     standard_nodes: List[Node]) -> List[NodeMatch]:
         """Match customer nodes against standard nodes."""
         matches = []
         used_standard_nodes = set()
+        standard_by_label = self._index_by_name(standard_nodes, lambda node: node.label)
         
         for customer_node in customer_nodes:
+            # Identical labels resolve by lookup unless every candidate must be scored
+            exact_match = standard_by_label.get(customer_node.label)
+            if (exact_match is not None and not self.track_all_candidates
+                    and exact_match.label not in used_standard_nodes):
+                used_standard_nodes.add(exact_match.label)
+                matches.append(self._create_node_match(customer_node, exact_match))
+                continue
+            
             best_match = None
             best_score = 0.0
             all_candidates = []
@@ -276,8 +293,17 @@ class FieldMatcher:
         """Match customer relationships against standard relationships."""
         matches = []
         used_standard_rels = set()
+        standard_by_type = self._index_by_name(standard_rels, lambda rel: rel.type)
         
         for customer_rel in customer_rels:
+            # Identical types resolve by lookup unless every candidate must be scored
+            exact_match = standard_by_type.get(customer_rel.type)
+            if (exact_match is not None and not self.track_all_candidates
+                    and exact_match.type not in used_standard_rels):
+                used_standard_rels.add(exact_match.type)
+                matches.append(self._create_relationship_match(customer_rel, exact_match))
+                continue
+            
             best_match = None
             best_score = 0.0
             all_candidates = []
@@ -400,42 +426,52 @@ class FieldMatcher:
         """Match properties between customer and standard schemas."""
         matches = []
         used_standard_props = set()
+        standard_by_property = self._index_by_name(standard_props, lambda prop: prop.property)
+        # Standard property names as a parallel list, extracted once for every customer property
+        standard_names = [prop.property for prop in standard_props]
         
         # Find matches for customer properties
         for customer_prop in customer_props:
+            customer_name = customer_prop.property
             best_match = None
+            best_similarity: Optional[SimilarityResult] = None
             best_score = 0.0
             
-            for standard_prop in standard_props:
-                if standard_prop.property in used_standard_props:
-                    continue
-                
-                similarity = self.similarity_engine.calculate(
-                    customer_prop.property, 
-                    standard_prop.property
-                )
-                
-                if similarity.score > best_score and similarity.score >= self.similarity_threshold:
-                    best_score = similarity.score
-                    best_match = standard_prop
+            # Identical property names resolve by lookup instead of scoring every candidate.
+            # Unlike nodes and relationships this needs no track_all_candidates guard:
+            # property matches keep no candidate list, so no trace loses scores.
+            exact_match = standard_by_property.get(customer_name)
+            if exact_match is not None and exact_match.property not in used_standard_props:
+                best_match = exact_match
+                best_similarity = self.similarity_engine.calculate(customer_name, exact_match.property)
+                best_score = best_similarity.score
+            else:
+                for standard_name, standard_prop in zip(standard_names, standard_props):
+                    if standard_name in used_standard_props:
+                        continue
+                    
+                    similarity = self.similarity_engine.calculate(customer_name, standard_name)
+                    
+                    if similarity.score > best_score and similarity.score >= self.similarity_threshold:
+                        best_score = similarity.score
+                        best_match = standard_prop
+                        best_similarity = similarity
             
-            if best_match:
+            # best_similarity is set together with best_match; checking both narrows its type
+            if best_match is not None and best_similarity is not None:
                 used_standard_props.add(best_match.property)
                 
                 # Check if it's underscore vs camelCase or case-only difference
-                is_underscore_to_camel = self._is_underscore_to_camelcase(customer_prop.property, best_match.property)
-                is_case_only_diff = customer_prop.property.lower() == best_match.property.lower() and customer_prop.property != best_match.property
+                is_underscore_to_camel = self._is_underscore_to_camelcase(customer_name, best_match.property)
+                is_case_only_diff = customer_name.lower() == best_match.property.lower() and customer_name != best_match.property
                 
                 # Adjust match type for formatting differences
                 match_type = self._classify_match_type(best_score)
                 if (is_underscore_to_camel or is_case_only_diff) and match_type == MatchType.EXACT:
                     match_type = MatchType.STRONG  # Downgrade to STRONG so it appears in recommendations
                 
-                # Create property match
-                # Re-calculate to get fresh result with metadata
-                prop_similarity = self.similarity_engine.calculate(
-                    customer_prop.property, best_match.property
-                )
+                # Create property match from the winning result, which already carries its metadata
+                prop_similarity = best_similarity
                 
                 # Extract technique contributions
                 technique_contributions = self._extract_technique_contributions(prop_similarity)
@@ -2,10 +2,13 @@
 Semantic similarity calculation using embeddings and cosine similarity.
 """
 
+import re
 import numpy as np
 from typing import Optional, Dict, Any
 from sklearn.metrics.pairwise import cosine_similarity
-from .base import SimilarityCalculator, SimilarityResult, AbbreviationExpander
+from .base import SimilarityCalculator, SimilarityResult, AbbreviationExpander, _CAMEL_BOUNDARY_RE
+
+_WHITESPACE_RUN_RE = re.compile(r'\s+')
 
 
 class SemanticSimilarity(SimilarityCalculator):
@@ -23,6 +26,7 @@ class SemanticSimilarity(SimilarityCalculator):
         self.use_sentence_transformers = use_sentence_transformers
         self._model = None
         self._embedding_dim = 384  # For 'all-MiniLM-L6-v2'
+        self._embedding_cache: Dict[str, np.ndarray] = {}
 
         # Initialize the embedding model
         if use_sentence_transformers:
@@ -37,9 +41,14 @@ class SemanticSimilarity(SimilarityCalculator):
     def _get_embedding(self, text: str) -> np.ndarray:
         """Get embedding vector for a text string."""
         if self._model:
-            # Prepare text for better semantic understanding
-            prepared_text = self._prepare_text_for_embedding(text)
-            return self._model.encode([prepared_text])[0]
+            # Each distinct text is encoded once; targets recur across many pairs
+            embedding = self._embedding_cache.get(text)
+            if embedding is None:
+                # Prepare text for better semantic understanding
+                prepared_text = self._prepare_text_for_embedding(text)
+                embedding = self._model.encode([prepared_text])[0]
+                self._embedding_cache[text] = embedding
+            return embedding
         else:
             # Return a zero vector if model is not available
             return np.zeros(self._embedding_dim)
@@ -62,16 +71,14 @@ class SemanticSimilarity(SimilarityCalculator):
     
     def _make_readable(self, text: str) -> str:
         """Convert field names to more readable format for embeddings."""
-        import re
-        
         # Handle camelCase
-        text = re.sub(r'([a-z])([A-Z])', r'\1 \2', text)
+        text = _CAMEL_BOUNDARY_RE.sub(r'\1 \2', text)
         
         # Handle snake_case and kebab-case
         text = text.replace('_', ' ').replace('-', ' ')
         
         # Clean up multiple spaces
-        text = re.sub(r'\s+', ' ', text)
+        text = _WHITESPACE_RUN_RE.sub(' ', text)
         
         return text.lower().strip()
     
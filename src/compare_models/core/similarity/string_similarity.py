@@ -5,9 +5,9 @@ This module provides similarity calculation techniques that rely on direct
 string comparison, such as Levenshtein distance, Jaro-Winkler, and fuzzy matching.
 """
 
-import Levenshtein
 from fuzzywuzzy import fuzz
-from typing import List, Tuple
+from rapidfuzz.distance import Indel, JaroWinkler
+from typing import Dict, List, Tuple
 
 from .base import SimilarityCalculator, SimilarityResult, AbbreviationExpander
 
@@ -32,7 +32,10 @@ class LevenshteinSimilarity(SimilarityCalculator):
                 metadata={"reason": "empty_string"}
             )
         
-        score = Levenshtein.ratio(text1.lower(), text2.lower())
+        lower1, lower2 = text1.lower(), text2.lower()
+        # Case-insensitive identity needs no edit-distance pass.
+        # Indel normalized similarity is the bit-parallel form of Levenshtein.ratio
+        score = 1.0 if lower1 == lower2 else Indel.normalized_similarity(lower1, lower2)
         confidence = 0.9 if score > 0.8 else 0.8
         
         return SimilarityResult(
@@ -63,7 +66,8 @@ class JaroWinklerSimilarity(SimilarityCalculator):
                 metadata={"reason": "empty_string"}
             )
             
-        score = Levenshtein.jaro_winkler(text1.lower(), text2.lower())
+        lower1, lower2 = text1.lower(), text2.lower()
+        score = 1.0 if lower1 == lower2 else JaroWinkler.similarity(lower1, lower2)
         confidence = 0.9 if score > 0.9 else 0.8
         
         return SimilarityResult(
@@ -114,6 +118,17 @@ class AbbreviationSimilarity(SimilarityCalculator):
     def __init__(self):
         super().__init__("abbreviation") 
         self.expander = AbbreviationExpander()
+        # Variations of each text (and their lowercased forms), built once per text
+        self._features: Dict[str, Tuple[List[str], List[str]]] = {}
+    
+    def _featurize(self, text: str) -> Tuple[List[str], List[str]]:
+        """Return the variations of a text and their lowercased forms, computing them once."""
+        features = self._features.get(text)
+        if features is None:
+            variations = self.expander.get_variations(text)
+            features = (variations, [variation.lower() for variation in variations])
+            self._features[text] = features
+        return features
     
     def calculate(self, text1: str, text2: str) -> SimilarityResult:
         """Calculate similarity with emphasis on abbreviation expansion."""
@@ -126,20 +141,26 @@ class AbbreviationSimilarity(SimilarityCalculator):
             )
         
         # Get all variations of both texts
-        variations1 = self.expander.get_variations(text1)
-        variations2 = self.expander.get_variations(text2)
+        variations1, lowered1 = self._featurize(text1)
+        variations2, lowered2 = self._featurize(text2)
         
         best_score = 0.0
         best_match = None
         
-        # Compare all variations against each other
-        for var1 in variations1:
-            for var2 in variations2:
-                # Use Jaro-Winkler for the actual comparison
-                score = Levenshtein.jaro_winkler(var1.lower(), var2.lower())
-                if score > best_score:
-                    best_score = score
-                    best_match = (var1, var2)
+        if lowered1[0] == lowered2[0]:
+            # The texts themselves (always the first variations) already match perfectly
+            best_score = 1.0
+            best_match = (variations1[0], variations2[0])
+        else:
+            # Compare all variations against each other
+            for var1, lower1 in zip(variations1, lowered1):
+                for var2, lower2 in zip(variations2, lowered2):
+                    # Use Jaro-Winkler for the actual comparison; pairs that cannot
+                    # beat the current best exit early and score 0.0
+                    score = JaroWinkler.similarity(lower1, lower2, score_cutoff=best_score)
+                    if score > best_score:
+                        best_score = score
+                        best_match = (var1, var2)
         
         # High confidence if we found a good match through expansion
         if best_match and best_match != (text1, text2):
@@ -152,8 +173,8 @@ class AbbreviationSimilarity(SimilarityCalculator):
             confidence=confidence,
             technique=self.name,
             metadata={
-                "variations1": variations1,
-                "variations2": variations2,
+                "variations1": list(variations1),
+                "variations2": list(variations2),
                 "best_match": best_match,
                 "used_expansion": best_match != (text1, text2) if best_match else False
             }
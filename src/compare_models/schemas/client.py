@@ -202,17 +202,11 @@ def get_graph_schema() -> GraphSchema:
             node_constraints.extend(constraints_by_label.get(additional_label, []))
             node_indexes.extend(indexes_by_label.get(additional_label, []))
         
-        # Remove duplicates while preserving order
-        unique_constraints = []
-        unique_indexes = []
-        
-        for constraint in node_constraints:
-            if constraint not in unique_constraints:
-                unique_constraints.append(constraint)
-                
-        for index in node_indexes:
-            if index not in unique_indexes:
-                unique_indexes.append(index)
+        # Remove duplicates while preserving order. Each SHOW CONSTRAINTS/INDEXES row
+        # builds one object shared by every label it covers, so identity is enough
+        # and avoids comparing every field of every pair.
+        unique_constraints = list({id(constraint): constraint for constraint in node_constraints}.values())
+        unique_indexes = list({id(index): index for index in node_indexes}.values())
         
         nodes.append(
             Node(
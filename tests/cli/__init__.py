@@ -0,0 +1 @@
+# CLI tests
\ No newline at end of file
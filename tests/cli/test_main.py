@@ -0,0 +1,65 @@
+"""
+Tests for the 'compare' command of the CLI.
+
+Database discovery and the schema comparator are patched out, so the command
+renders a fixed result set without a Neo4j connection.
+"""
+
+import os
+import unittest
+from unittest import mock
+
+from click.testing import CliRunner
+
+from cli import main
+
+
+SCRIPT_HEADER = "Unified Compliance Script"
+
+RESULTS = {
+    'summary': {'overall_compliance_score': 0.5},
+    'recommendations_by_type': {
+        'node_renames': [{
+            'current_label': 'Cust',
+            'standard_label': 'Customer',
+            'priority': 'HIGH',
+            'cypher_command': 'MATCH (n:Cust) SET n:Customer REMOVE n:Cust'
+        }]
+    }
+}
+
+
+class TestCompareCommand(unittest.TestCase):
+    """Test cases for the compare command's output options."""
+
+    def invoke_compare(self, *extra_args):
+        """Run 'compare' against a patched database and return its output."""
+        database = mock.Mock(is_system=False)
+        database.name = 'neo4j'
+        discovery = mock.MagicMock()
+        discovery.__enter__.return_value.discover_databases.return_value = [database]
+        comparator = mock.Mock()
+        comparator.return_value.compare_database_to_standard.return_value = RESULTS
+
+        args = ['compare', '--uri', 'neo4j://localhost', '--username', 'neo4j',
+                '--password', 'secret', '--database', 'neo4j', *extra_args]
+        with mock.patch.object(main, 'DatabaseDiscovery', return_value=discovery), \
+                mock.patch.object(main, 'SchemaComparator', comparator), \
+                mock.patch.dict(os.environ):
+            result = CliRunner().invoke(main.cli, args)
+
+        self.assertEqual(result.exit_code, 0, result.output)
+        self.assertIn("Node Label Changes Required", result.output)
+        return result.output
+
+    def test_script_shown_by_default(self):
+        """The unified compliance script is shown without any option."""
+        self.assertIn(SCRIPT_HEADER, self.invoke_compare())
+
+    def test_no_script_omits_script(self):
+        """--no-script leaves out the unified compliance script."""
+        self.assertNotIn(SCRIPT_HEADER, self.invoke_compare('--no-script'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,65 @@
+"""
+Tests for the Rich entity-centric panels.
+
+Entity panels are fixed at 100 columns, so long property recommendations wrap;
+the wrapped lines must stay inside the tree's guide column.
+"""
+
+import io
+import unittest
+
+from rich.console import Console
+
+from cli.rich_formatters import format_entity_centric_node
+
+
+LONG_RECOMMENDATION = (
+    "Consider renaming CUSTNUM to customer_number so the property name follows "
+    "the snake_case naming standard used by the reference model"
+)
+
+
+def render(renderable) -> list:
+    """Render to plain text lines without colour codes."""
+    console = Console(file=io.StringIO(), width=120, color_system=None)
+    console.print(renderable)
+    return console.file.getvalue().splitlines()
+
+
+class TestEntityCentricNodePanel(unittest.TestCase):
+    """Test cases for the entity-centric node panel."""
+
+    def test_wrapped_label_keeps_tree_indent(self):
+        """Continuation lines of a long label stay indented under its guide."""
+        node_data = {
+            'source': {'label': 'Customer'},
+            'match': {'label': 'Customer', 'type': 'exact', 'score': 1.0},
+            'properties': {
+                'matches': [{
+                    'source': 'CUSTNUM',
+                    'target': 'customer_number',
+                    'score': 0.91,
+                    'recommendations': [LONG_RECOMMENDATION]
+                }],
+                'missing': [{'name': 'email', 'type': 'STRING', 'mandatory': True}]
+            }
+        }
+
+        lines = render(format_entity_centric_node(node_data))
+        first = next(i for i, line in enumerate(lines) if 'CUSTNUM →' in line)
+        label_column = lines[first].index('CUSTNUM →')
+        continuation = lines[first + 1]
+
+        # The label is longer than the panel, so it must have wrapped
+        self.assertNotIn('reference model', lines[first])
+        self.assertIn('reference model', continuation)
+
+        # The continuation starts in the label's column, behind the guide lines
+        guide = continuation[:label_column]
+        self.assertEqual(guide.strip(' │'), '')
+        self.assertIn('│', guide[1:])
+        self.assertNotEqual(continuation[label_column], ' ')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1 @@
+# Common tests
\ No newline at end of file
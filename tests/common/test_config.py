@@ -0,0 +1,108 @@
+"""
+Test suite for the cached Neo4j settings loader.
+"""
+
+import os
+import subprocess
+import sys
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from src.compare_models.common import config
+
+
+NEO4J_ENVIRONMENT = {
+    'NEO4J_URI': 'neo4j://localhost:7687',
+    'NEO4J_USERNAME': 'neo4j',
+    'NEO4J_PASSWORD': 'secret',
+    'NEO4J_DATABASE': 'neo4j'
+}
+
+
+class TestSettingsCache(unittest.TestCase):
+    """Test cases for get_settings() and its cache."""
+
+    def setUp(self):
+        """Start each test from an empty cache and a known environment."""
+        environment = mock.patch.dict(os.environ, NEO4J_ENVIRONMENT)
+        environment.start()
+        self.addCleanup(environment.stop)
+        config.clear_settings_cache()
+        self.addCleanup(config.clear_settings_cache)
+
+    def test_settings_cached_for_same_environment(self):
+        """Repeated calls with an unchanged environment share one instance."""
+        self.assertIs(config.get_settings(), config.get_settings())
+
+    def test_clear_cache_picks_up_changed_environment(self):
+        """Changing NEO4J_* and clearing the cache produces new settings."""
+        before = config.get_settings()
+
+        os.environ['NEO4J_DATABASE'] = 'analytics'
+        config.clear_settings_cache()
+        after = config.get_settings()
+
+        self.assertIsNot(before, after)
+        self.assertEqual(before.database, 'neo4j')
+        self.assertEqual(after.database, 'analytics')
+
+    def test_changed_environment_without_clearing(self):
+        """The cache is keyed on NEO4J_*, so env changes apply without a manual clear."""
+        before = config.get_settings()
+        self.assertEqual(before.database, 'neo4j')
+
+        with mock.patch.dict(os.environ, {'NEO4J_DATABASE': 'analytics'}):
+            after = config.get_settings()
+            self.assertIsNot(before, after)
+            self.assertEqual(after.database, 'analytics')
+            self.assertEqual(config.settings.database, 'analytics')
+
+        # Restoring the environment returns the settings cached for it
+        self.assertIs(config.get_settings(), before)
+        self.assertEqual(config.settings.database, 'neo4j')
+
+    def test_clear_cache_rebuilds_settings(self):
+        """Clearing the cache rebuilds settings even for the same environment."""
+        before = config.get_settings()
+        config.clear_settings_cache()
+        self.assertIsNot(before, config.get_settings())
+
+
+class TestLazySettings(unittest.TestCase):
+    """Test cases for the lazily resolved module-level settings."""
+
+    def tearDown(self):
+        """Drop settings cached while a test's environment was patched."""
+        config.clear_settings_cache()
+
+    def test_import_without_credentials(self):
+        """The module imports without any NEO4J_* variables set."""
+        environment = {
+            key: value for key, value in os.environ.items()
+            if not key.upper().startswith('NEO4J_')
+        }
+        result = subprocess.run(
+            [sys.executable, '-c', 'import src.compare_models.common.config'],
+            cwd=Path(__file__).resolve().parents[2],
+            env=environment,
+            capture_output=True,
+            text=True
+        )
+        self.assertEqual(result.returncode, 0, result.stderr)
+
+    def test_settings_resolves_through_cached_loader(self):
+        """config.settings is the instance get_settings() caches."""
+        with mock.patch.dict(os.environ, NEO4J_ENVIRONMENT):
+            config.clear_settings_cache()
+            self.assertIs(config.settings, config.get_settings())
+            self.assertEqual(config.settings.uri, NEO4J_ENVIRONMENT['NEO4J_URI'])
+
+    def test_unknown_attribute_raises(self):
+        """Other missing attributes still raise AttributeError."""
+        with self.assertRaises(AttributeError):
+            config.not_a_setting
+
+
+if __name__ == '__main__':
+    unittest.main()
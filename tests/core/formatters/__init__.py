@@ -0,0 +1 @@
+# Formatter tests
\ No newline at end of file
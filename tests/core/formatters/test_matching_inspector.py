@@ -0,0 +1,55 @@
+"""
+Test suite for exporting matching traces from the matching inspector.
+"""
+
+import unittest
+
+from src.compare_models.core.formatters import MatchingInspector
+from src.compare_models.core.formatters.matching_inspector import MatchCandidate
+from src.compare_models.core.similarity import MatchType
+
+
+class TestTraceExport(unittest.TestCase):
+    """Test cases for export_traces() and iter_traces()."""
+
+    def setUp(self):
+        """Record a matched and an unmatched trace."""
+        self.inspector = MatchingInspector()
+
+        self.inspector.start_trace('CUSTNUM', 'node')
+        self.inspector.add_step("Compared labels", 'abbreviation', 0.92, {'expanded': 'customer number'})
+        self.inspector.add_candidate(MatchCandidate(
+            target_name='customer_number',
+            final_score=0.92,
+            technique_scores={'abbreviation': 0.92, 'fuzzy': 0.41},
+            match_type=MatchType.STRONG,
+            validation_result={},
+            recommendation="Rename CUSTNUM to customer_number"
+        ))
+        self.inspector.complete_trace('customer_number', "Abbreviation expansion matched")
+
+        self.inspector.start_trace('HAS_THING', 'relationship')
+        self.inspector.add_step("Compared types", 'fuzzy', 0.2)
+        self.inspector.complete_trace(None, "No candidate above threshold")
+
+    def test_iter_traces_matches_export(self):
+        """Streaming the traces yields exactly what export_traces() returns."""
+        for detailed in (False, True):
+            with self.subTest(detailed=detailed):
+                self.assertEqual(
+                    list(self.inspector.iter_traces(detailed=detailed)),
+                    self.inspector.export_traces(detailed=detailed)
+                )
+
+    def test_steps_only_when_detailed(self):
+        """Step details are exported only for detailed traces."""
+        brief = next(self.inspector.iter_traces(detailed=False))
+        detailed = next(self.inspector.iter_traces(detailed=True))
+
+        self.assertNotIn('steps', brief)
+        self.assertEqual(detailed['steps'][0]['details'], {'expanded': 'customer number'})
+        self.assertEqual(detailed['candidates'][0]['primary_technique'], 'abbreviation')
+
+
+if __name__ == '__main__':
+    unittest.main()